@@ -1,8 +1,12 @@
+import itertools
+import json
 import random
 import re
 import time
 import os
+import atexit
 import logging
+import multiprocessing
 import requests
 from datetime import datetime, timedelta
 from urllib.parse import quote_plus
@@ -10,7 +14,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from utils import init_driver, login, save_screenshot
+from utils import init_driver, login, save_screenshot, flush_screenshots, reset_screenshot_writer
 from rotate_headline import setup_logging, clear_debug_images
 from questionnaire_handler import handle_questionnaire
 
@@ -211,6 +215,347 @@ def ai_check_relevance(job_title, job_titles_config, text_context="", timeout=10
         return False, ""
 
 
+# Union of every known job-tuple selector; one DOM query returns listings
+# regardless of which layout Naukri serves, instead of N sequential fallbacks
+JOB_TUPLE_SELECTOR = (
+    ".srp-jobtuple-wrapper, .jobTupleHeader, .cust-job-tuple, "
+    ".jobTuple, div[type='tuple']"
+)
+
+# Static success-message patterns (lowercase) scanned for after an apply click
+_SUCCESS_PATTERNS = (
+    "you have successfully applied",
+    "application successful",
+    "applied successfully",
+    "you have already applied",
+    "application confirmed",
+    "successfully applied",
+)
+
+# Optional Aho-Corasick automaton: matches every static pattern in one linear
+# pass over the page text instead of N independent substring scans
+try:
+    import ahocorasick
+
+    _SUCCESS_AUTOMATON = ahocorasick.Automaton()
+    for _pattern in _SUCCESS_PATTERNS:
+        _SUCCESS_AUTOMATON.add_word(_pattern, _pattern)
+    _SUCCESS_AUTOMATON.make_automaton()
+except ImportError:
+    _SUCCESS_AUTOMATON = None
+_COMPANY_SITE_RE = re.compile(r"apply on company site", re.IGNORECASE)
+
+# Static XPaths reused on every application attempt. XPath 1.0 has no
+# case-insensitive contains(), so translate() folds the element text to
+# lowercase; one tree walk then covers every pattern and case variant.
+_XPATH_UPPER = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_XPATH_LOWER = "abcdefghijklmnopqrstuvwxyz"
+_VISIBLE_SUCCESS_XPATH = "//*[" + " or ".join(
+    f"contains(translate(text(), '{_XPATH_UPPER}', '{_XPATH_LOWER}'), '{p}')"
+    for p in _SUCCESS_PATTERNS
+) + "]"
+_DIALOG_CONFIRM_XPATH = (
+    ".//button[contains(text(), 'Submit') or contains(text(), 'Confirm') "
+    "or contains(text(), 'Apply') or contains(text(), 'OK')]"
+)
+
+# Scans the visible page text inside the browser with one compiled RegExp and
+# returns only the matched pattern (or null) over the wire, instead of shipping
+# the full page source (often hundreds of KB) to Python for every check.
+_SUCCESS_SCAN_JS = """
+    var rx = new RegExp(arguments[0], 'i');
+    var match = document.body.innerText.match(rx);
+    return match ? match[0].toLowerCase() : null;
+"""
+
+
+# Polls the apply-result page in-browser and calls back the moment the outcome
+# is detectable (success text or a confirmation dialog), instead of sleeping a
+# fixed 4-7s and then scanning with separate WebDriver round-trips.
+_APPLY_OUTCOME_JS = """
+    var patterns = arguments[0];
+    var timeoutMs = arguments[1];
+    var callback = arguments[arguments.length - 1];
+    var deadline = Date.now() + timeoutMs;
+    (function poll() {
+        var text = document.body.innerText.toLowerCase();
+        for (var i = 0; i < patterns.length; i++) {
+            if (text.indexOf(patterns[i]) >= 0)
+                return callback({status: 'success', pattern: patterns[i]});
+        }
+        var buttons = document.querySelectorAll(
+            "[role='dialog'] button, .modal button, .popup button, .dialog button");
+        for (var j = 0; j < buttons.length; j++) {
+            if (/submit|confirm|apply|ok/i.test(buttons[j].innerText))
+                return callback({status: 'needs_confirm'});
+        }
+        if (Date.now() > deadline) return callback({status: 'timeout'});
+        setTimeout(poll, 200);
+    })();
+"""
+
+
+def wait_for_apply_outcome(driver, dynamic_pattern=None, timeout=8):
+    """Watch the page after an apply click and return as soon as the outcome is
+    detectable. Returns a dict with 'status' of 'success', 'needs_confirm' or
+    'timeout' (plus 'pattern' on success)."""
+    patterns = [dynamic_pattern.lower()] if dynamic_pattern else []
+    patterns.extend(_SUCCESS_PATTERNS)
+    try:
+        driver.set_script_timeout(timeout + 2)
+        return driver.execute_async_script(_APPLY_OUTCOME_JS, patterns, int(timeout * 1000))
+    except Exception as e:
+        logging.debug(f"In-browser apply-outcome poll failed: {e}")
+        time.sleep(random.uniform(4, 7))
+        return {"status": "timeout"}
+
+
+# Polls for either the success text (regex over innerText) or a visible
+# success element (XPath probe) in one async round-trip, returning as soon as
+# either appears. Replaces the previous three-stage page_source-loop -> XPath
+# -> rescan sequence.
+_SUCCESS_POLL_JS = """
+    var rx = new RegExp(arguments[0], 'i');
+    var xpath = arguments[1];
+    var timeoutMs = arguments[2];
+    var callback = arguments[arguments.length - 1];
+    var deadline = Date.now() + timeoutMs;
+    (function poll() {
+        var m = document.body.innerText.match(rx);
+        if (m) return callback({found: true, text: m[0].toLowerCase()});
+        var node = document.evaluate(xpath, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        if (node) return callback({found: true, text: node.innerText.trim()});
+        if (Date.now() > deadline) return callback({found: false, text: null});
+        setTimeout(poll, 100);
+    })();
+"""
+
+
+def poll_for_success(driver, dynamic_pattern=None, timeout=5):
+    """Poll in-browser for success text or a visible success element.
+    Returns the matched text, or None when neither shows up in time."""
+    patterns = [dynamic_pattern.lower()] if dynamic_pattern else []
+    patterns.extend(_SUCCESS_PATTERNS)
+    rx = "|".join(re.escape(p) for p in patterns)
+    try:
+        driver.set_script_timeout(timeout + 2)
+        result = driver.execute_async_script(
+            _SUCCESS_POLL_JS, rx, _VISIBLE_SUCCESS_XPATH, int(timeout * 1000))
+        return result.get("text") if result.get("found") else None
+    except Exception as e:
+        logging.debug(f"In-browser success poll failed: {e}")
+        return scan_for_success_text(driver, dynamic_pattern)
+
+
+def _detect_success(driver, dynamic_success_text, safe_co, company, stage="", matched=None):
+    """Poll for the success outcome (unless the caller already holds the
+    matched text) and record it with exactly one log line and one screenshot.
+    Returns the matched text or None."""
+    if matched is None:
+        matched = poll_for_success(driver, dynamic_success_text)
+    if matched:
+        if stage:
+            logging.info("✓ Found success message after confirmation: '%s' for job at %s", matched, company)
+        else:
+            logging.info("✓ Found success message: '%s' for job at %s", matched, company)
+        name = f"application_success_{stage}_{safe_co}" if stage else f"application_success_{safe_co}"
+        save_screenshot(driver, name, "success")
+    return matched
+
+
+def scan_for_success_text(driver, dynamic_pattern=None):
+    """Return the success pattern found on the page, or None.
+    The scan runs in-browser; only the short matched string crosses the wire.
+    Goes straight to CDP when possible -- one hop to the browser instead of
+    the WebDriver->driver->CDP round-trip of execute_script."""
+    patterns = [dynamic_pattern.lower()] if dynamic_pattern else []
+    patterns.extend(_SUCCESS_PATTERNS)
+    rx = "|".join(re.escape(p) for p in patterns)
+    try:
+        result = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": (
+                "(document.body.innerText.match(new RegExp("
+                + json.dumps(rx) + ", 'i')) || [null])[0]"
+            ),
+            "returnByValue": True,
+        })
+        value = result.get("result", {}).get("value")
+        return value.lower() if value else None
+    except Exception as e:
+        logging.debug(f"CDP success scan failed, trying execute_script: {e}")
+    try:
+        return driver.execute_script(_SUCCESS_SCAN_JS, rx)
+    except Exception as e:
+        logging.debug(f"In-browser success scan failed, falling back to page_source: {e}")
+        page_text = driver.page_source.lower()
+        if dynamic_pattern and dynamic_pattern.lower() in page_text:
+            return dynamic_pattern.lower()
+        if _SUCCESS_AUTOMATON is not None:
+            for _, pattern in _SUCCESS_AUTOMATON.iter(page_text):
+                return pattern
+            return None
+        for pattern in _SUCCESS_PATTERNS:
+            if pattern in page_text:
+                return pattern
+        return None
+
+# Extracts all job-tuple metadata in one browser-side pass. Each Selenium
+# find_elements/get_attribute call is a separate WebDriver round-trip, so for
+# 50 listings the per-element approach costs seconds of pure RPC overhead.
+_JOB_METADATA_JS = """
+    return Array.from(document.querySelectorAll(
+        '.srp-jobtuple-wrapper, .jobTuple, .cust-job-tuple, ' +
+        'div[type="tuple"], .jobTupleHeader, article.jobTupleHeader'
+    )).map(function (tuple) {
+        var link = tuple.querySelector('a.title, a[title]');
+        var comp = tuple.querySelector('.comp-name, .company-name');
+        var loc = tuple.querySelector('.locWdth, .location');
+        return {
+            title: link ? link.innerText.trim() : '',
+            href: link ? link.href : '',
+            company: comp ? comp.innerText.trim() : '',
+            location: loc ? loc.innerText.trim() : ''
+        };
+    });
+"""
+
+
+def extract_job_listings(driver):
+    """Return a list of {title, href, company, location} dicts for every job
+    tuple on the current page, using a single execute_script round-trip."""
+    try:
+        return driver.execute_script(_JOB_METADATA_JS) or []
+    except Exception as e:
+        logging.error(f"Batch job metadata extraction failed: {e}")
+        return []
+
+
+# Per-worker state for the parallel apply pool. Each worker process owns its
+# own driver; Selenium sessions must never be shared across processes/threads.
+_worker_driver = None
+_worker_keywords = None
+
+
+def _init_parallel_worker(cookies, relevance_keywords):
+    """Pool initializer: start a driver in this worker process and restore the
+    logged-in session from cookies captured by the main process.
+
+    Must not raise -- a failing Pool initializer makes the pool respawn
+    workers in a loop while the parent blocks on results; a worker without a
+    driver simply reports every job as not applied instead."""
+    global _worker_driver, _worker_keywords
+    _worker_keywords = relevance_keywords
+
+    # The forked worker inherits the parent's QueueHandler but not the
+    # QueueListener thread (threads don't survive fork), so its records would
+    # be enqueued into a queue nobody drains. Log straight to the console.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+        force=True,
+    )
+
+    # Same fork problem for the background screenshot writer: its threads
+    # don't survive the fork, so the inherited executor must be replaced
+    reset_screenshot_writer()
+
+    try:
+        _worker_driver = init_driver()
+        atexit.register(_worker_driver.quit)
+        _worker_driver.get("https://www.naukri.com")
+        for cookie in cookies:
+            cookie.pop("expiry", None)
+            try:
+                _worker_driver.add_cookie(cookie)
+            except Exception:
+                continue
+        _worker_driver.refresh()
+        logging.info("Parallel worker ready (session cookies restored)")
+    except Exception as e:
+        logging.error(f"Parallel worker failed to initialize: {e}")
+        _worker_driver = None
+
+
+def _parallel_apply_worker(job):
+    """Apply to a single job URL inside a worker process.
+    Returns (job_link, applied) so the parent can update dedup state."""
+    job_link, job_title, company, title_relevant = job
+    if _worker_driver is None:
+        return job_link, False
+    try:
+        _worker_driver.get(job_link)
+        wait_for_page_ready(_worker_driver)
+        applied = check_and_apply(_worker_driver, job_title, company, _worker_keywords, title_relevant)
+        return job_link, applied
+    except Exception as e:
+        logging.error(f"Worker failed on {job_link}: {e}")
+        return job_link, False
+
+
+def _collect_job_candidates(driver, relevance_keywords, applied_jobs):
+    """Harvest (link, title, company, title_relevant) tuples from the current
+    listings page without opening any tabs. Cheap single-driver pass that feeds
+    the parallel worker pool."""
+    candidates = []
+
+    for job in extract_job_listings(driver):
+        job_link = job.get("href")
+        job_title = job.get("title") or "Unknown Title"
+        company = job.get("company") or "Unknown Company"
+
+        if not job_link or job_link in applied_jobs:
+            continue
+
+        title_relevant, _ = is_job_relevant(job_title, relevance_keywords)
+        candidates.append((job_link, job_title, company, title_relevant))
+
+    return candidates
+
+
+def process_job_listings_parallel(driver, max_applications, relevance_keywords,
+                                  applied_jobs, workers):
+    """Process the listings page with a pool of worker processes, each owning
+    its own logged-in driver. Used when PARALLEL_WORKERS > 1."""
+    candidates = _collect_job_candidates(driver, relevance_keywords, applied_jobs)
+    if not candidates:
+        logging.error("No job listings found for parallel processing")
+        save_screenshot(driver, "no_job_listings_parallel", "failure")
+        return 0
+
+    logging.info(f"Dispatching {len(candidates)} jobs to {workers} parallel workers")
+
+    applied_count = 0
+    cookies = driver.get_cookies()
+    pool = multiprocessing.Pool(
+        processes=workers,
+        initializer=_init_parallel_worker,
+        initargs=(cookies, relevance_keywords),
+    )
+    try:
+        for job_link, applied in pool.imap_unordered(_parallel_apply_worker, candidates):
+            if applied:
+                applied_count += 1
+                applied_jobs.add(job_link)
+                save_applied_job(job_link)
+                logging.info("Progress: Applied to %d/%d jobs", applied_count, max_applications)
+            if applied_count >= max_applications:
+                logging.info(f"✓ Reached target application limit ({max_applications})")
+                pool.terminate()
+                break
+        else:
+            pool.close()
+    except BaseException:
+        # join() on a still-running pool raises and would mask the original
+        # error (or a KeyboardInterrupt); terminate first
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    return applied_count
+
+
 def load_applied_jobs():
     """Load previously applied job URLs from the dedup file.
     Handles migration from old root-level location to debug/."""
@@ -265,10 +610,11 @@ def apply_for_jobs():
     3. Navigate directly (no UI filter clicking) -- Naukri defaults to 'Recommended' sort
     4. Process listings with strict relevance checks
     5. Paginate if needed, try next title if quota not met
-    """
-    setup_logging()
-    clear_debug_images()
 
+    Logging setup and debug-image clearing are the caller's job (main.job or
+    the __main__ block): doing them here wiped the shared debug/images dir
+    and reconfigured logging mid-run when tasks execute concurrently.
+    """
     job_titles = os.getenv("JOB_TITLES", "DevOps Engineer, Site Reliability Engineer").split(",")
     job_titles = [title.strip() for title in job_titles if title.strip()]
 
@@ -278,6 +624,7 @@ def apply_for_jobs():
     experience = os.getenv("JOB_EXPERIENCE", "2")
     max_applications = int(os.getenv("MAX_APPLICATIONS", "3"))
     freshness_days = int(os.getenv("JOB_FRESHNESS_DAYS", "1"))
+    parallel_workers = int(os.getenv("PARALLEL_WORKERS", "1"))
 
     relevance_keywords = build_relevance_keywords(job_titles)
     logging.info(f"Relevance keywords: {relevance_keywords}")
@@ -305,20 +652,31 @@ def apply_for_jobs():
         if freshness_days not in freshness_tiers:
             freshness_tiers = [freshness_days] + [f for f in freshness_tiers if f != freshness_days]
 
+        # (title, location) pairs that produced no applications, keyed to the
+        # widest freshness window tried: a narrower window is a strict subset
+        # of those results, so retrying the pair there is wasted searching
+        fruitless_pairs = {}
+
         for fresh_days in freshness_tiers:
             if applied_count >= max_applications:
                 break
 
-            titles_shuffled = job_titles[:]
-            random.shuffle(titles_shuffled)
+            # Shuffled cartesian product: every (title, location) pair is tried
+            # at most once per tier and no pair can be re-picked by chance
+            combos = list(itertools.product(job_titles, locations))
+            random.shuffle(combos)
 
             logging.info(f"--- Freshness tier: last {fresh_days} day(s) ---")
 
-            for title in titles_shuffled:
+            for title, location in combos:
                 if applied_count >= max_applications:
                     break
 
-                location = random.choice(locations)
+                widest_empty = fruitless_pairs.get((title, location))
+                if widest_empty is not None and fresh_days <= widest_empty:
+                    logging.info(f"Skipping '{title}' in {location}: nothing applied at {widest_empty}d freshness")
+                    continue
+
                 search_url = build_search_url(title, location, experience, fresh_days)
                 logging.info(f"Searching: '{title}' in {location} (exp={experience}, fresh={fresh_days}d)")
                 logging.info(f"URL: {search_url}")
@@ -330,12 +688,22 @@ def apply_for_jobs():
                     "experience": experience, "freshness_days": fresh_days,
                 }
                 remaining = max_applications - applied_count
-                new_apps = process_job_listings(
-                    driver, remaining, relevance_keywords, applied_jobs,
-                    search_context=search_ctx,
-                )
+                if parallel_workers > 1:
+                    new_apps = process_job_listings_parallel(
+                        driver, remaining, relevance_keywords, applied_jobs,
+                        workers=parallel_workers,
+                    )
+                else:
+                    new_apps = process_job_listings(
+                        driver, remaining, relevance_keywords, applied_jobs,
+                        search_context=search_ctx,
+                    )
                 applied_count += new_apps
 
+                if new_apps == 0:
+                    prev = fruitless_pairs.get((title, location), 0)
+                    fruitless_pairs[(title, location)] = max(prev, fresh_days)
+
                 if applied_count < max_applications:
                     time.sleep(random.uniform(3, 6))
 
@@ -356,6 +724,7 @@ def apply_for_jobs():
     finally:
         driver.quit()
         logging.info("Browser closed")
+        flush_screenshots()
 
         interval_hours = int(os.getenv("INTERVAL_HOURS", "1"))
         if interval_hours > 0:
@@ -365,6 +734,16 @@ def apply_for_jobs():
 
     return applied_count
 
+def wait_for_page_ready(driver, timeout=10):
+    """Wait until the document finishes loading instead of sleeping a fixed time."""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except TimeoutException:
+        logging.debug(f"Page did not reach readyState 'complete' within {timeout}s")
+
+
 def search_for_jobs(driver, search_url):
     """Navigate directly to a pre-built Naukri search URL.
 
@@ -376,13 +755,10 @@ def search_for_jobs(driver, search_url):
 
     try:
         driver.get(search_url)
-        time.sleep(random.uniform(4, 7))
 
         try:
             WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR,
-                    ".srp-jobtuple-wrapper, .jobTupleHeader, .cust-job-tuple, "
-                    ".jobTuple, div[type='tuple']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_TUPLE_SELECTOR))
             )
             logging.info("Search results loaded successfully")
         except TimeoutException:
@@ -425,7 +801,7 @@ def _click_next_page_button(driver, current_page):
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", btn)
                     time.sleep(random.uniform(0.5, 1.0))
                     driver.execute_script("arguments[0].click();", btn)
-                    time.sleep(random.uniform(4, 7))
+                    wait_for_page_ready(driver)
                     return True
         except Exception:
             continue
@@ -446,7 +822,7 @@ def _click_next_page_button(driver, current_page):
                     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
                     time.sleep(random.uniform(0.5, 1.0))
                     driver.execute_script("arguments[0].click();", el)
-                    time.sleep(random.uniform(4, 7))
+                    wait_for_page_ready(driver)
                     return True
     except Exception:
         pass
@@ -509,7 +885,7 @@ def _click_next_page_button(driver, current_page):
                         if el.is_displayed():
                             driver.execute_script("arguments[0].click();", el)
                             logging.info(f"AI clicked next-page via CSS: {sel}")
-                            time.sleep(random.uniform(4, 7))
+                            wait_for_page_ready(driver)
                             return True
                 elif line.startswith("xpath:"):
                     sel = line[6:].strip().strip("'\"")
@@ -518,7 +894,7 @@ def _click_next_page_button(driver, current_page):
                         if el.is_displayed():
                             driver.execute_script("arguments[0].click();", el)
                             logging.info(f"AI clicked next-page via XPath: {sel}")
-                            time.sleep(random.uniform(4, 7))
+                            wait_for_page_ready(driver)
                             return True
         except Exception as e:
             logging.debug(f"AI pagination fallback failed: {e}")
@@ -531,175 +907,140 @@ def process_job_listings(driver, max_applications, relevance_keywords, applied_j
                          page=1, max_pages=3, search_context=None):
     """
     Process the job listings page and apply to suitable jobs.
-    Paginates up to max_pages when more relevant jobs are needed.
+    Paginates iteratively up to max_pages when more relevant jobs are needed.
     """
     applied_count = 0
-    tabs_opened = 0
-    max_tabs_to_open = max_applications * 5
-    
-    try:
-        job_selectors = [
-            ".srp-jobtuple-wrapper",
-            ".jobTuple",
-            ".cust-job-tuple",
-            "div[type='tuple']",
-            ".jobTupleHeader",
-            "article.jobTupleHeader",
-        ]
-        
-        job_listings = []
-        for selector in job_selectors:
-            listings = driver.find_elements(By.CSS_SELECTOR, selector)
-            if listings:
-                job_listings = listings
-                logging.info(f"Found {len(listings)} job listings with selector '{selector}' (page {page})")
-                break
-        
-        if not job_listings:
-            logging.error(f"No job listings found on page {page}")
-            save_screenshot(driver, f"no_job_listings_page_{page}", "failure")
-            return 0
-        
-        logging.info(f"Found {len(job_listings)} job listings on page {page}, targeting {max_applications} applications")
-    
-        for index, job in enumerate(job_listings):
-            if applied_count >= max_applications:
-                logging.info(f"✓ Reached target application limit ({max_applications})")
-                break
-                
-            if tabs_opened >= max_tabs_to_open:
-                logging.info(f"Reached maximum tab-open limit ({max_tabs_to_open})")
-                break
-                
-            try:
-                job_title_elements = job.find_elements(By.CSS_SELECTOR, "a.title")
-                if not job_title_elements:
-                    job_title_elements = job.find_elements(By.CSS_SELECTOR, "a[title]")
-                
-                if not job_title_elements:
-                    logging.warning(f"Could not find job title element for job {index+1}, skipping")
-                    continue
-                
-                job_title_element = job_title_elements[0]
-                job_title = job_title_element.text.strip()
-                
-                try:
-                    company_elements = job.find_elements(By.CSS_SELECTOR, ".comp-name, .company-name")
-                    company = company_elements[0].text.strip() if company_elements else "Unknown Company"
-                except:
-                    company = "Unknown Company"
-                    
+    details_opened = 0
+    max_details_to_open = max_applications * 5
+
+    while page <= max_pages:
+        try:
+            # Remember the listings URL so we can return for click-based pagination;
+            # job details are loaded in this same tab (no window.open/switch/close)
+            listings_url = driver.current_url
+
+            job_listings = extract_job_listings(driver)
+
+            if not job_listings:
+                logging.error(f"No job listings found on page {page}")
+                save_screenshot(driver, f"no_job_listings_page_{page}", "failure")
+                return applied_count
+
+            logging.info("Found %d job listings on page %d, targeting %d applications", len(job_listings), page, max_applications)
+
+            for index, job in enumerate(job_listings):
+                if applied_count >= max_applications:
+                    logging.info(f"✓ Reached target application limit ({max_applications})")
+                    break
+
+                if details_opened >= max_details_to_open:
+                    logging.info(f"Reached maximum detail-page limit ({max_details_to_open})")
+                    break
+
                 try:
-                    location_elements = job.find_elements(By.CSS_SELECTOR, ".locWdth, .location")
-                    location = location_elements[0].text.strip() if location_elements else "Unknown Location"
-                except:
-                    location = "Unknown Location"
-                
-                logging.info(f"Processing job {index+1}: {job_title} at {company} in {location}")
-                
-                main_window = driver.current_window_handle
-                
-                job_link = job_title_element.get_attribute("href")
-                
-                if not job_link:
-                    logging.warning(f"No link found for job {index+1}, skipping")
-                    continue
-                
-                if job_link in applied_jobs:
-                    logging.info(f"⊘ Already applied to this job previously, skipping: {job_title}")
-                    continue
-                
-                title_relevant, matched_keyword = is_job_relevant(job_title, relevance_keywords)
-                if title_relevant:
-                    logging.info(f"Title is relevant (matched: '{matched_keyword}')")
-                else:
-                    job_titles_config = os.getenv("JOB_TITLES", "DevOps Engineer, Site Reliability Engineer")
-                    ai_relevant, ai_reason = ai_check_relevance(job_title, job_titles_config, timeout=10)
-                    if ai_relevant:
-                        title_relevant = True
-                        matched_keyword = f"ai:{ai_reason[:60]}"
-                        logging.info(f"AI title check: '{job_title}' -> RELEVANT ({ai_reason})")
-                    elif ai_reason:
-                        logging.info(f"AI title check: '{job_title}' -> NOT RELEVANT ({ai_reason}), skipping")
+                    job_title = job.get("title") or "Unknown Title"
+                    company = job.get("company") or "Unknown Company"
+                    location = job.get("location") or "Unknown Location"
+                    job_link = job.get("href")
+
+                    if not job_link:
+                        logging.warning("No link found for job %d, skipping", index + 1)
                         continue
-                    else:
-                        logging.info(f"Title '{job_title}' did not match keywords, will check JD for relevance")
-                
-                tabs_opened += 1
-                
-                driver.execute_script(f"window.open('{job_link}', '_blank');")
-                
-                time.sleep(random.uniform(2.5, 5))
-                windows = driver.window_handles
-                driver.switch_to.window(windows[-1])
-                
-                logging.info(f"Opened job details in new tab: {job_title}")
-                
-                apply_result = check_and_apply(driver, job_title, company, relevance_keywords, title_relevant)
-                
-                if apply_result:
-                    applied_count += 1
-                    applied_jobs.add(job_link)
-                    save_applied_job(job_link)
-                    logging.info(f"Progress: Applied to {applied_count}/{max_applications} jobs")
-                    
-                driver.close()
-                driver.switch_to.window(main_window)
-                logging.info("Returned to job listings page")
-                
-                time.sleep(random.uniform(2, 4))
-                
-            except Exception as e:
-                logging.error(f"Error processing job listing: {e}")
-                save_screenshot(driver, f"job_listing_error_{index}", "failure")
-                
-                try:
-                    driver.switch_to.window(main_window)
-                except:
-                    pass
-                
-                continue
-        
-        if applied_count < max_applications and page < max_pages:
-            next_page_loaded = False
 
-            if search_context:
-                try:
-                    next_url = build_search_url(
-                        search_context["title"], search_context["location"],
-                        search_context["experience"], search_context["freshness_days"],
-                        page=page + 1,
-                    )
-                    logging.info(f"Navigating to page {page + 1} via URL: {next_url}")
-                    driver.get(next_url)
-                    time.sleep(random.uniform(4, 7))
-                    test_listings = driver.find_elements(By.CSS_SELECTOR,
-                        ".srp-jobtuple-wrapper, .jobTupleHeader, .cust-job-tuple, "
-                        ".jobTuple, div[type='tuple']")
-                    if test_listings:
-                        next_page_loaded = True
-                        logging.info(f"Page {page + 1} loaded via URL ({len(test_listings)} listings)")
+                    logging.info("Processing job %d: %s at %s in %s", index + 1, job_title, company, location)
+
+                    if job_link in applied_jobs:
+                        logging.info("⊘ Already applied to this job previously, skipping: %s", job_title)
+                        continue
+
+                    title_relevant, matched_keyword = is_job_relevant(job_title, relevance_keywords)
+                    if title_relevant:
+                        logging.info("Title is relevant (matched: '%s')", matched_keyword)
                     else:
-                        logging.info(f"Page {page + 1} URL returned no listings, end of results")
+                        job_titles_config = os.getenv("JOB_TITLES", "DevOps Engineer, Site Reliability Engineer")
+                        ai_relevant, ai_reason = ai_check_relevance(job_title, job_titles_config, timeout=10)
+                        if ai_relevant:
+                            title_relevant = True
+                            matched_keyword = f"ai:{ai_reason[:60]}"
+                            logging.info("AI title check: '%s' -> RELEVANT (%s)", job_title, ai_reason)
+                        elif ai_reason:
+                            logging.info("AI title check: '%s' -> NOT RELEVANT (%s), skipping", job_title, ai_reason)
+                            continue
+                        else:
+                            logging.info("Title '%s' did not match keywords, will check JD for relevance", job_title)
+
+                    details_opened += 1
+
+                    driver.get(job_link)
+                    wait_for_page_ready(driver)
+
+                    logging.info("Opened job details: %s", job_title)
+
+                    apply_result = check_and_apply(driver, job_title, company, relevance_keywords, title_relevant)
+
+                    if apply_result:
+                        applied_count += 1
+                        applied_jobs.add(job_link)
+                        save_applied_job(job_link)
+                        logging.info("Progress: Applied to %d/%d jobs", applied_count, max_applications)
+
+                    time.sleep(random.uniform(2, 4))
+
                 except Exception as e:
-                    logging.warning(f"URL-based pagination failed: {e}")
+                    logging.error("Error processing job listing: %s", e)
+                    save_screenshot(driver, f"job_listing_error_{index}", "failure")
+                    continue
+
+        except Exception as e:
+            logging.error(f"Error finding job listings: {e}")
+            save_screenshot(driver, "job_listings_error", "failure")
+            break
+
+        if applied_count >= max_applications or details_opened >= max_details_to_open:
+            break
 
-            if not next_page_loaded:
-                next_page_loaded = _click_next_page_button(driver, page)
+        if page >= max_pages:
+            break
 
-            if next_page_loaded:
-                additional_applications = process_job_listings(
-                    driver, max_applications - applied_count, relevance_keywords, applied_jobs,
-                    page=page + 1, max_pages=max_pages, search_context=search_context,
+        next_page_loaded = False
+
+        if search_context:
+            try:
+                next_url = build_search_url(
+                    search_context["title"], search_context["location"],
+                    search_context["experience"], search_context["freshness_days"],
+                    page=page + 1,
                 )
-                applied_count += additional_applications
-            else:
-                logging.info("No more pages available")
-    
-    except Exception as e:
-        logging.error(f"Error finding job listings: {e}")
-        save_screenshot(driver, "job_listings_error", "failure")
-    
+                logging.info(f"Navigating to page {page + 1} via URL: {next_url}")
+                driver.get(next_url)
+                try:
+                    WebDriverWait(driver, 15).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, JOB_TUPLE_SELECTOR))
+                    )
+                except TimeoutException:
+                    pass
+                test_listings = driver.find_elements(By.CSS_SELECTOR, JOB_TUPLE_SELECTOR)
+                if test_listings:
+                    next_page_loaded = True
+                    logging.info(f"Page {page + 1} loaded via URL ({len(test_listings)} listings)")
+                else:
+                    logging.info(f"Page {page + 1} URL returned no listings, end of results")
+            except Exception as e:
+                logging.warning(f"URL-based pagination failed: {e}")
+
+        if not next_page_loaded:
+            # The click-based fallback needs the listings page on screen again
+            if driver.current_url != listings_url:
+                driver.get(listings_url)
+                wait_for_page_ready(driver)
+            next_page_loaded = _click_next_page_button(driver, page)
+
+        if not next_page_loaded:
+            logging.info("No more pages available")
+            break
+
+        page += 1
+
     return applied_count
 
 def check_and_apply(driver, job_title, company, relevance_keywords, title_relevant):
@@ -708,11 +1049,12 @@ def check_and_apply(driver, job_title, company, relevance_keywords, title_releva
     If the listing title didn't match relevance keywords, the JD is checked
     as a second chance before skipping.
     """
+    safe_co = company.replace(' ', '_')[:20]
+
     try:
         time.sleep(random.uniform(2.5, 5))
         
-        screenshot_path = save_screenshot(driver, f"job_details_{job_title.replace(' ', '_')[:20]}", "info")
-        logging.info(f"Screenshot saved: {screenshot_path}")
+        save_screenshot(driver, f"job_details_{job_title.replace(' ', '_')[:20]}", "info")
         
         if not title_relevant:
             jd_text = ""
@@ -729,8 +1071,8 @@ def check_and_apply(driver, job_title, company, relevance_keywords, title_releva
                     break
 
             if not jd_text:
-                logging.info(f"⊘ Skipping irrelevant job: '{job_title}' at {company} - no JD container found")
-                save_screenshot(driver, f"skipped_irrelevant_{company.replace(' ', '_')[:20]}", "info")
+                logging.info("⊘ Skipping irrelevant job: '%s' at %s - no JD container found", job_title, company)
+                save_screenshot(driver, f"skipped_irrelevant_{safe_co}", "info")
                 return False
 
             jd_relevant, matched_keyword = is_job_relevant(jd_text, relevance_keywords, strict=True)
@@ -742,206 +1084,131 @@ def check_and_apply(driver, job_title, company, relevance_keywords, title_releva
                 if ai_relevant:
                     jd_relevant = True
                     matched_keyword = f"ai:{ai_reason[:60]}"
-                    logging.info(f"AI JD check: '{job_title}' at {company} -> RELEVANT ({ai_reason})")
+                    logging.info("AI JD check: '%s' at %s -> RELEVANT (%s)", job_title, company, ai_reason)
                 else:
                     if ai_reason:
-                        logging.info(f"AI JD check: '{job_title}' at {company} -> NOT RELEVANT ({ai_reason})")
+                        logging.info("AI JD check: '%s' at %s -> NOT RELEVANT (%s)", job_title, company, ai_reason)
                     else:
-                        logging.info(f"⊘ Skipping: '{job_title}' at {company} - no keyword match in title or JD")
-                    save_screenshot(driver, f"skipped_irrelevant_{company.replace(' ', '_')[:20]}", "info")
+                        logging.info("⊘ Skipping: '%s' at %s - no keyword match in title or JD", job_title, company)
+                    save_screenshot(driver, f"skipped_irrelevant_{safe_co}", "info")
                     return False
-            logging.info(f"JD is relevant (matched: '{matched_keyword}')")
-        
-        company_site_buttons = driver.find_elements(By.XPATH, 
-            "//*[contains(text(), 'Apply on company site') or contains(text(), 'Apply on Company Site')]")
+            logging.info("JD is relevant (matched: '%s')", matched_keyword)
         
-        if company_site_buttons:
-            logging.info(f"Job at {company} requires applying on company site - skipping")
-            screenshot_path = save_screenshot(driver, f"skipped_company_site_{company.replace(' ', '_')[:20]}", "info")
-            logging.info(f"Company site application screenshot saved: {screenshot_path}")
+        try:
+            requires_company_site = driver.execute_script(
+                "return document.body.innerText.toLowerCase().indexOf('apply on company site') >= 0;")
+        except Exception:
+            requires_company_site = bool(_COMPANY_SITE_RE.search(driver.page_source))
+
+        if requires_company_site:
+            logging.info("Job at %s requires applying on company site - skipping", company)
+            save_screenshot(driver, f"skipped_company_site_{safe_co}", "info")
             return False
-            
-        apply_buttons = []
-        
-        selectors = [
-            "//button[contains(text(), 'Apply') or contains(@class, 'apply')]",
-            "//a[contains(text(), 'Apply') or contains(@class, 'apply')]",
-            "//span[contains(text(), 'Apply') and not(contains(text(), 'company'))]",
-            "//div[contains(text(), 'Apply') and not(contains(text(), 'company'))]",
-            "//input[@value='Apply']",
-            "//*[contains(@class, 'apply-button')]"
-        ]
-        
-        for selector in selectors:
-            buttons = driver.find_elements(By.XPATH, selector)
-            apply_buttons.extend(buttons)
-            
+
+        # One CSS query covers the class-based variants; the text-only XPath
+        # fallback runs only when the class match comes up empty
+        apply_buttons = driver.find_elements(By.CSS_SELECTOR,
+            "button[class*='apply'], a[class*='apply'], input[value='Apply'], [class*='apply-button']")
+
         if not apply_buttons:
-            logging.info(f"No direct apply button found for job at {company} - skipping")
-            screenshot_path = save_screenshot(driver, f"no_apply_button_{company.replace(' ', '_')[:20]}", "info")
-            logging.info(f"No apply button screenshot saved: {screenshot_path}")
+            apply_buttons = driver.find_elements(By.XPATH,
+                "//button[contains(text(), 'Apply')] | //a[contains(text(), 'Apply')] | "
+                "//span[contains(text(), 'Apply') and not(contains(text(), 'company'))] | "
+                "//div[contains(text(), 'Apply') and not(contains(text(), 'company'))]")
+
+        if not apply_buttons:
+            logging.info("No direct apply button found for job at %s - skipping", company)
+            save_screenshot(driver, f"no_apply_button_{safe_co}", "info")
             return False
             
         apply_button = apply_buttons[0]
-        logging.info(f"Found Apply button for job at {company}")
-        
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", apply_button)
-        time.sleep(random.uniform(1, 2.5))
+        logging.info("Found Apply button for job at %s", company)
         
-        screenshot_path = save_screenshot(driver, f"before_apply_{company.replace(' ', '_')[:20]}", "info")
-        logging.info(f"Before apply screenshot saved: {screenshot_path}")
+        # Instant (non-smooth) scrolling completes before the call returns, so
+        # no settle sleep is needed before the screenshot or the click
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", apply_button)
+
+        save_screenshot(driver, f"before_apply_{safe_co}", "info")
         
         apply_button.click()
-        logging.info(f"Clicked Apply button for job at {company}")
-        time.sleep(random.uniform(4, 7))
-        
-        screenshot_path = save_screenshot(driver, f"after_apply_click_{company.replace(' ', '_')[:20]}", "info")
-        logging.info(f"After apply click screenshot saved: {screenshot_path}")
-        
+        logging.info("Clicked Apply button for job at %s", company)
+
+        dynamic_success_text = f"Applied to {job_title}"
+        outcome = wait_for_apply_outcome(driver, dynamic_success_text)
+        logging.info("Apply outcome: %s", outcome.get("status"))
+
+        save_screenshot(driver, f"after_apply_click_{safe_co}", "info")
+
         questionnaire_handled = handle_questionnaire(driver, job_title, company)
         if questionnaire_handled:
             logging.info("Questionnaire handled, checking for success...")
             time.sleep(random.uniform(3, 6))
-        
-        success = False
-        matched_pattern = None
-        
-        dynamic_success_text = f"Applied to {job_title}"
-        
-        success_patterns = [
-            dynamic_success_text,
-            "You have successfully applied",
-            "Application successful",
-            "Applied successfully",
-            "You have already applied",
-            "Application confirmed",
-            "successfully applied to",
-            "Successfully applied"
-        ]
-        
-        page_text = driver.page_source.lower()
-        
-        for pattern in success_patterns:
-            if pattern.lower() in page_text:
-                success = True
-                matched_pattern = pattern
-                logging.info(f"✓ Found success message in source: '{pattern}' for job at {company}")
-                screenshot_path = save_screenshot(driver, f"application_success_{company.replace(' ', '_')[:20]}", "success")
-                logging.info(f"Application success screenshot saved: {screenshot_path}")
-                break
-                
-        if not success:
-            success_xpath = (
-                f"//*[contains(., 'Applied to') and contains(., '{job_title}')] | "
-                "//*[contains(text(), 'successfully applied') or contains(text(), 'Successfully applied')]"
-            )
-            success_messages = driver.find_elements(By.XPATH, success_xpath)
-            
-            if success_messages:
-                success = True
-                message_text = success_messages[0].text.strip()
-                matched_pattern = message_text
-                logging.info(f"✓ Found visible success message: for '{job_title}' at {company}")
-                
-                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", success_messages[0])
-                time.sleep(random.uniform(1, 2.5))
-                
-                screenshot_path = save_screenshot(driver, f"application_success_visible_{company.replace(' ', '_')[:20]}", "success")
-                logging.info(f"Visible success screenshot saved: {screenshot_path}")
-                
+
+        matched_pattern = _detect_success(
+            driver, dynamic_success_text, safe_co, company,
+            matched=outcome.get("pattern") if outcome.get("status") == "success" else None,
+        )
+        success = bool(matched_pattern)
+
         if not success:
             try:
                 dialogs = driver.find_elements(By.CSS_SELECTOR, 
                     ".modal, .popup, .dialog, .overlay, [role='dialog']")
                 
                 if dialogs:
-                    logging.info(f"Found dialog/popup when applying to job at {company}")
-                    screenshot_path = save_screenshot(driver, f"application_dialog_{company.replace(' ', '_')[:20]}", "info")
-                    logging.info(f"Dialog screenshot saved: {screenshot_path}")
+                    logging.info("Found dialog/popup when applying to job at %s", company)
+                    save_screenshot(driver, f"application_dialog_{safe_co}", "info")
                     
                     for dialog in dialogs:
-                        confirm_buttons = dialog.find_elements(By.XPATH, 
-                            ".//button[contains(text(), 'Submit') or contains(text(), 'Confirm') or contains(text(), 'Apply') or contains(text(), 'OK')]")
+                        confirm_buttons = dialog.find_elements(By.XPATH, _DIALOG_CONFIRM_XPATH)
                         
                         if confirm_buttons:
                             driver.execute_script("arguments[0].style.border='3px solid red'", confirm_buttons[0])
-                            time.sleep(random.uniform(1, 2.5))
-                            
-                            screenshot_path = save_screenshot(driver, f"before_dialog_confirmation_{company.replace(' ', '_')[:20]}", "info")
-                            logging.info(f"Before dialog confirmation screenshot saved: {screenshot_path}")
+
+                            save_screenshot(driver, f"before_dialog_confirmation_{safe_co}", "info")
                             
                             confirm_buttons[0].click()
-                            logging.info(f"Clicked confirmation button in dialog for job at {company}")
+                            logging.info("Clicked confirmation button in dialog for job at %s", company)
                             time.sleep(random.uniform(4, 7))
                             
-                            screenshot_path = save_screenshot(driver, f"after_dialog_confirmation_{company.replace(' ', '_')[:20]}", "info")
-                            logging.info(f"After dialog confirmation screenshot saved: {screenshot_path}")
+                            save_screenshot(driver, f"after_dialog_confirmation_{safe_co}", "info")
                             
-                            page_text = driver.page_source.lower()
-                            for pattern in success_patterns:
-                                if pattern.lower() in page_text:
-                                    success = True
-                                    matched_pattern = pattern
-                                    logging.info(f"✓ Found success message after confirmation: '{pattern}' for job at {company}")
-                                    screenshot_path = save_screenshot(driver, f"application_success_confirmed_{company.replace(' ', '_')[:20]}", "success")
-                                    logging.info(f"Success after confirmation screenshot saved: {screenshot_path}")
-                                    break
-                                    
-                            if not success:
-                                success_messages = driver.find_elements(By.XPATH, 
-                                    "//*[contains(text(), 'successfully applied') or contains(text(), 'Successfully applied')]")
-                                
-                                if success_messages:
-                                    success = True
-                                    message_text = success_messages[0].text.strip()
-                                    matched_pattern = message_text
-                                    logging.info(f"✓ Found visible success message after confirmation: '{message_text}' for job at {company}")
-                                    
-                                    driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", success_messages[0])
-                                    time.sleep(random.uniform(1, 2.5))
-                                    
-                                    screenshot_path = save_screenshot(driver, f"application_success_visible_confirmed_{company.replace(' ', '_')[:20]}", "success")
-                                    logging.info(f"Visible success after confirmation screenshot saved: {screenshot_path}")
-                                    
+                            matched_pattern = _detect_success(
+                                driver, dynamic_success_text, safe_co, company, stage="confirmed")
+                            if matched_pattern:
+                                success = True
+
             except Exception as e:
-                logging.error(f"Error handling application confirmation: {e}")
-                screenshot_path = save_screenshot(driver, f"confirmation_error_{company.replace(' ', '_')[:20]}", "failure")
-                logging.info(f"Confirmation error screenshot saved: {screenshot_path}")
+                logging.error("Error handling application confirmation: %s", e)
+                save_screenshot(driver, f"confirmation_error_{safe_co}", "failure")
         
         if success:
-            logging.info(f"✅ SUCCESSFULLY APPLIED TO JOB: {job_title} at {company}")
+            logging.info("✅ SUCCESSFULLY APPLIED TO JOB: %s at %s", job_title, company)
             if matched_pattern:
-                logging.info(f"✅ Success")
+                logging.info("✅ Success")
             
-            driver.execute_script("""
-                var successDiv = document.createElement('div');
-                successDiv.style.position = 'fixed';
-                successDiv.style.top = '10px';
-                successDiv.style.left = '10px';
-                successDiv.style.backgroundColor = 'green';
-                successDiv.style.color = 'white';
-                successDiv.style.padding = '10px';
-                successDiv.style.borderRadius = '5px';
-                successDiv.style.zIndex = '9999';
-                successDiv.style.fontWeight = 'bold';
-                successDiv.textContent = 'SUCCESSFULLY APPLIED';
-                document.body.appendChild(successDiv);
-            """)
-            time.sleep(random.uniform(1, 2.5))
-            screenshot_path = save_screenshot(driver, f"final_success_{company.replace(' ', '_')[:20]}", "success")
-            logging.info(f"Final success screenshot saved: {screenshot_path}")
+            # No injected DOM banner before the shot: the log and the
+            # 'success' filename prefix already record the outcome, and the
+            # banner cost a scripted DOM mutation plus a full second of sleep
+            save_screenshot(driver, f"final_success_{safe_co}", "success")
             return True
         else:
-            logging.warning(f"❌ Could not confirm successful application to job at {company}")
-            screenshot_path = save_screenshot(driver, f"final_unconfirmed_{company.replace(' ', '_')[:20]}", "warning")
-            logging.info(f"Final unconfirmed application screenshot saved: {screenshot_path}")
+            logging.warning("❌ Could not confirm successful application to job at %s", company)
+            save_screenshot(driver, f"final_unconfirmed_{safe_co}", "warning")
             return False
         
     except Exception as e:
-        logging.error(f"Error applying for job: {e}")
-        screenshot_path = save_screenshot(driver, f"application_error_{company.replace(' ', '_')[:20]}", "failure")
-        logging.info(f"Application error screenshot saved: {screenshot_path}")
+        logging.error("Error applying for job: %s", e)
+        # If the driver session itself is broken, the screenshot attempt will
+        # raise too -- guard it so the original error isn't masked and the
+        # failure path doesn't stall on the WebDriver command timeout
+        try:
+            save_screenshot(driver, f"application_error_{safe_co}", "failure")
+        except Exception as screenshot_error:
+            logging.warning("Could not capture error screenshot: %s", screenshot_error)
         return False
 
 if __name__ == "__main__":
+    setup_logging()
+    clear_debug_images()
     apply_for_jobs()
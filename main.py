@@ -3,6 +3,7 @@ import time
 import os
 import traceback
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from rotate_headline import rotate_headline, clear_debug_images, setup_logging
 from apply_jobs import apply_for_jobs
@@ -12,6 +13,14 @@ from dotenv import load_dotenv
 # Load environment variables from .env
 load_dotenv()
 
+# Parse configuration once at import so every scheduled run sees the same
+# values and the lower()/int() coercions don't repeat per run
+RUN_SUMMARY_ROTATION = os.getenv("RUN_SUMMARY_ROTATION", "true").lower() == "true"
+RUN_JOB_APPLICATIONS = os.getenv("RUN_JOB_APPLICATIONS", "false").lower() == "true"
+EARLY_ACCESS_ROLES = os.getenv("EARLY_ACCESS_ROLES", "false").lower() == "true"
+NAUKRI_EMAIL = os.getenv("NAUKRI_EMAIL")
+INTERVAL_HOURS = int(os.getenv("INTERVAL_HOURS", "1"))  # Default to 1 hour
+
 def job():
     try:
         # Set up logging and clear debug images before starting
@@ -20,26 +29,34 @@ def job():
         
         start_time = datetime.now()
         logging.info(f"Starting scheduled tasks at {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        logging.info(f"User account: {os.getenv('NAUKRI_EMAIL')}")
+        logging.info(f"User account: {NAUKRI_EMAIL}")
         
-        # Run headline rotation if enabled
-        if os.getenv("RUN_SUMMARY_ROTATION", "true").lower() == "true":
-            logging.info("Running headline rotation task")
-            rotate_headline()
-            logging.info("Headline rotation task completed")
-        else:
-            logging.info("Headline rotation is disabled in settings")
-        
-        # Run job application if enabled
-        if os.getenv("RUN_JOB_APPLICATIONS", "false").lower() == "true":
-            logging.info("Running job application task")
-            jobs_applied = apply_for_jobs()
-            logging.info(f"Job application task completed. Applied to {jobs_applied} jobs")
-        else:
-            logging.info("Job application is disabled in settings")
+        # Run headline rotation and job application concurrently -- each task
+        # owns its own driver, so when both are enabled the wall clock is the
+        # longer of the two instead of their sum
+        futures = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if RUN_SUMMARY_ROTATION:
+                logging.info("Running headline rotation task")
+                futures["rotation"] = executor.submit(rotate_headline)
+            else:
+                logging.info("Headline rotation is disabled in settings")
+
+            if RUN_JOB_APPLICATIONS:
+                logging.info("Running job application task")
+                futures["applications"] = executor.submit(apply_for_jobs)
+            else:
+                logging.info("Job application is disabled in settings")
+
+            if "rotation" in futures:
+                futures["rotation"].result()
+                logging.info("Headline rotation task completed")
+            if "applications" in futures:
+                jobs_applied = futures["applications"].result()
+                logging.info(f"Job application task completed. Applied to {jobs_applied} jobs")
 
         # Run early access roles (share interest) if enabled
-        if os.getenv("EARLY_ACCESS_ROLES", "false").lower() == "true":
+        if EARLY_ACCESS_ROLES:
             logging.info("Running early access roles task")
             share_interest()
             logging.info("Early access roles task completed")
@@ -51,9 +68,8 @@ def job():
         logging.info(f"All tasks completed in {duration:.1f} minutes")
         
         # Calculate and log next run time
-        interval_hours = int(os.getenv("INTERVAL_HOURS", "1"))  # Default to 1 hour
-        if interval_hours > 0:
-            next_run = datetime.now() + timedelta(hours=interval_hours)
+        if INTERVAL_HOURS > 0:
+            next_run = datetime.now() + timedelta(hours=INTERVAL_HOURS)
             logging.info(f"Next scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
         
         logging.info("=== Task Execution Complete ===")
@@ -64,9 +80,6 @@ def job():
 # Initialize logging
 setup_logging()
 
-# Get environment variables with defaults
-INTERVAL_HOURS = int(os.getenv("INTERVAL_HOURS", "1"))  # Default to 1 hour
-
 # Set up the schedule
 if INTERVAL_HOURS > 0:
     schedule.every(INTERVAL_HOURS).hours.do(job)
@@ -81,8 +94,14 @@ job()
 if INTERVAL_HOURS > 0:
     while True:
         try:
+            # Sleep exactly until the next scheduled job instead of waking
+            # every minute to poll
+            idle = schedule.idle_seconds()
+            if idle is None:
+                break
+            if idle > 0:
+                time.sleep(idle)
             schedule.run_pending()
-            time.sleep(60)  # Check every minute to reduce CPU usage
         except Exception as e:
             logging.error(f"Scheduler error: {e}")
             time.sleep(300)  # Wait 5 minutes on error before trying again
@@ -918,11 +918,21 @@ def _check_application_success(driver, use_ai=False):
             continue
 
     try:
-        page_source = driver.page_source.lower()
-        if "successfully applied" in page_source or "application submitted" in page_source:
+        # innerText over CDP is 5-20x smaller than the serialized page source
+        # and contains exactly the text we scan for
+        page_text = driver.execute_cdp_cmd("Runtime.evaluate", {
+            "expression": "document.body.innerText",
+            "returnByValue": True,
+        })["result"]["value"].lower()
+        if "successfully applied" in page_text or "application submitted" in page_text:
             return True
     except Exception:
-        pass
+        try:
+            page_source = driver.page_source.lower()
+            if "successfully applied" in page_source or "application submitted" in page_source:
+                return True
+        except Exception:
+            pass
 
     if use_ai:
         page_state = _ai_identify_page_state(driver)
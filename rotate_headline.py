@@ -3,20 +3,90 @@ import random
 import time
 import os
 import sys
-import traceback
-import glob
+import atexit
 import shutil
 import logging
+import logging.handlers
+import queue
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
-from utils import init_driver, login, save_screenshot
+from utils import init_driver, login, save_screenshot, reset_screenshot_dedup
 
 # Global log file path
 CURRENT_LOG_FILE = None
 
+# Background log listener thread (drains the queue to file/console)
+_LOG_LISTENER = None
+
+
+def _shutdown_logging():
+    """Stop the active log listener and flush/close its handlers.
+    Registered once at exit; also called by setup_logging before installing a
+    replacement so repeated setups can't stack listeners and file handles."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is None:
+        return
+    try:
+        _LOG_LISTENER.stop()
+    except Exception:
+        pass
+    for handler in _LOG_LISTENER.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+        # MemoryHandler.close flushes into its target but leaves it open
+        target = getattr(handler, "target", None)
+        if target is not None:
+            try:
+                target.close()
+            except Exception:
+                pass
+    _LOG_LISTENER = None
+
+
+atexit.register(_shutdown_logging)
+
+# Parsed headlines cache keyed by file mtime, so hourly scheduled runs skip
+# the reopen/re-decode unless the file actually changed
+_HEADLINES_CACHE = {"mtime": None, "data": None}
+
+# Locators reused across the rotation/upload flows
+LOADING_LOC = (By.CSS_SELECTOR, ".saving, .loading, .spinner")
+RESUME_HEADLINE_LOC = (By.CSS_SELECTOR, ".resumeHeadline")
+HEADLINE_FIELD_LOC = (By.ID, "resumeHeadlineTxt")
+
+
+def load_headlines(path="headlines.json"):
+    """Return the parsed headlines list, re-reading only when the file changed."""
+    mtime = os.stat(path).st_mtime
+    if _HEADLINES_CACHE["mtime"] != mtime:
+        with open(path, "r") as file:
+            _HEADLINES_CACHE["data"] = json.load(file)
+        _HEADLINES_CACHE["mtime"] = mtime
+    return _HEADLINES_CACHE["data"]
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler with a 64KB write buffer and no per-record flush, so log
+    records cost a memcpy instead of a syscall. The MemoryHandler batching and
+    the atexit flushes ensure records still reach disk."""
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, encoding=self.encoding, buffering=65536)
+
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging():
     """Set up logging to capture important events to a log file in debug/logs directory"""
     global CURRENT_LOG_FILE
@@ -38,13 +108,35 @@ def setup_logging():
     log_filepath = os.path.join(debug_logs_dir, log_filename)
     CURRENT_LOG_FILE = log_filepath
     
+    global _LOG_LISTENER
+
+    # Tear down any previous listener/handlers before installing new ones
+    _shutdown_logging()
+
+    formatter = logging.Formatter('%(asctime)s - %(message)s')
+
+    # Buffer file writes in batches of 50 records (flushing immediately on
+    # ERROR and at close) so each logging call isn't a separate disk write
+    file_handler = BufferedFileHandler(log_filepath, mode='w', encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=50, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True)
+
+    stream_handler = logging.StreamHandler(
+        open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False))
+    stream_handler.setFormatter(formatter)
+
+    # The orchestration thread only enqueues records; a background listener
+    # thread does the actual file/console IO
+    log_queue = queue.Queue(-1)
+    _LOG_LISTENER = logging.handlers.QueueListener(
+        log_queue, buffered_handler, stream_handler)
+    _LOG_LISTENER.start()
+
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filepath, mode='w', encoding='utf-8'),
-            logging.StreamHandler(open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False))
-        ]
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+        force=True  # Replace any handlers installed earlier
     )
     
     # Log initial message
@@ -55,20 +147,42 @@ def setup_logging():
 def clear_debug_images():
     """Clear the debug/images directory before starting"""
     debug_images_dir = os.path.join(os.getcwd(), "debug", "images")
-    if os.path.exists(debug_images_dir):
-        logging.info(f"Clearing debug images")
-        try:
-            # Remove all files in the images directory
-            for file in glob.glob(os.path.join(debug_images_dir, "*.*")):
-                os.remove(file)
-        except Exception as e:
-            logging.error(f"Failed to clear debug images: {e}")
-    else:
-        # Create directory if it doesn't exist
+    logging.info("Clearing debug images")
+    try:
+        # One C-level tree removal instead of glob + per-file unlink calls;
+        # also covers the directory-missing case
+        shutil.rmtree(debug_images_dir, ignore_errors=True)
+        os.makedirs(debug_images_dir, exist_ok=True)
+        reset_screenshot_dedup()
+    except Exception as e:
+        logging.error(f"Failed to clear debug images: {e}")
+
+def wait_for(driver, locator, timeout=10):
+    """Wait for an element to be present instead of sleeping a fixed time.
+    Returns the element, or None if it never appeared."""
+    try:
+        return WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located(locator)
+        )
+    except TimeoutException:
+        return None
+
+
+def wait_for_js(driver, expr, timeout=10, interval=0.1):
+    """Poll a JavaScript predicate every `interval` seconds and return its
+    value as soon as it's truthy. Returns None on timeout. Avoids the
+    tail-latency waste of fixed sleeps when the condition resolves early."""
+    end = time.time() + timeout
+    while time.time() < end:
         try:
-            os.makedirs(debug_images_dir, exist_ok=True)
-        except Exception as e:
-            logging.error(f"Failed to create debug images directory: {e}")
+            result = driver.execute_script(f"return ({expr});")
+        except Exception:
+            result = None
+        if result:
+            return result
+        time.sleep(interval)
+    return None
+
 
 def rotate_headline():
     """Update the resume headline with random content from headlines.json"""
@@ -85,22 +199,18 @@ def rotate_headline():
         # Navigate to profile page
         driver.get("https://www.naukri.com/mnjuser/profile")
         logging.info("Navigated to profile page")
-        time.sleep(5)
-        
+        wait_for(driver, RESUME_HEADLINE_LOC)
+
         # Extract current headline for verification
         current_headline = ""
         try:
+            # innerText on the container aggregates all descendant text, so a
+            # single property read replaces the child-walking loop
             current_headline = driver.execute_script("""
-                var headlineElements = document.querySelectorAll('.resumeHeadline span, .resumeHeadline p, .resumeHeadline div');
-                for (var i = 0; i < headlineElements.length; i++) {
-                    var text = headlineElements[i].textContent.trim();
-                    if (text && text.length > 5) {
-                        return text;
-                    }
-                }
-                return null;
-            """)
-            
+                var el = document.querySelector('.resumeHeadline');
+                return el ? el.innerText.trim() : '';
+            """) or ""
+
             if current_headline:
                 current_headline = current_headline.strip()
                 logging.info(f"Current headline: '{current_headline}'")
@@ -109,59 +219,28 @@ def rotate_headline():
         
         # Load random headline, ensuring it's different from the current one
         try:
-            with open("headlines.json", "r") as file:
-                data = json.load(file)
-                
-                # If we have current headline, try to select a different one
-                if current_headline and len(data) > 1:
-                    # Extract just the core headline from the current headline text
-                    for item in data:
-                        if item["headline"] in current_headline:
-                            current_headline = item["headline"]
-                            break
-                    
-                    # Filter out the current headline
-                    different_headlines = [h for h in data if h["headline"] != current_headline]
-                    
-                    if different_headlines:
-                        entry = random.choice(different_headlines)
-                        logging.info("Selected a different headline for update")
-                    else:
-                        entry = random.choice(data)
-                else:
-                    entry = random.choice(data)
-                
-                headline = entry["headline"]
-                logging.info(f"Selected new headline: {headline}")
-                
-                # Check if the selected headline is the same as the current one
-                if headline in current_headline:
-                    logging.info("Selected headline is the same as current one")
-                    
-                    if len(data) == 1:
-                        logging.info("No different headline available, skipping update")
-                        # Still proceed to upload resume
-                        upload_resume(driver)
-                        driver.quit()
-                        # Log next scheduled time
-                        log_next_scheduled_time()
-                        return
-                    else:
-                        # Try to select a different one
-                        different_headlines = [h for h in data if h["headline"] != headline and h["headline"] != current_headline]
-                        if different_headlines:
-                            entry = random.choice(different_headlines)
-                            headline = entry["headline"]
-                            logging.info(f"Selected alternative headline: {headline}")
-                        else:
-                            logging.info("No different headline available, skipping update")
-                            # Still proceed to upload resume
-                            upload_resume(driver)
-                            driver.quit()
-                            # Log next scheduled time
-                            log_next_scheduled_time()
-                            return
-                
+            data = load_headlines()
+
+            # Identify which configured headline (if any) is currently on the
+            # profile, then pick from the others in a single pass
+            matched = next(
+                (d["headline"] for d in data if d["headline"] in current_headline), None)
+
+            candidates = [d for d in data if d["headline"] != matched]
+            entry = random.choice(candidates or data)
+            headline = entry["headline"]
+            logging.info(f"Selected new headline: {headline}")
+
+            if matched and headline == matched:
+                # Only possible when a single headline is configured
+                logging.info("No different headline available, skipping update")
+                # Still proceed to upload resume (the profile page is loaded)
+                upload_resume(driver, already_on_profile=True)
+                driver.quit()
+                # Log next scheduled time
+                log_next_scheduled_time()
+                return
+
         except Exception as e:
             logging.error(f"Failed to load headlines: {e}")
             save_screenshot(driver, "headline_json_error", "failure")
@@ -179,8 +258,9 @@ def rotate_headline():
             logging.error("✗ Failed to update headline")
             save_screenshot(driver, "profile_update_failed", "failure")
         
-        # Proceed to upload resume
-        upload_resume(driver)
+        # Proceed to upload resume; a successful update has just navigated
+        # back to the profile page for verification
+        upload_resume(driver, already_on_profile=headline_updated)
             
     except Exception as e:
         logging.error(f"Error during headline rotation: {e}")
@@ -201,16 +281,18 @@ def log_next_scheduled_time():
     else:
         logging.info("No schedule set - running in single execution mode")
 
-def upload_resume(driver):
-    """Upload the resume file from the current directory"""
+def upload_resume(driver, already_on_profile=False):
+    """Upload the resume file from the current directory.
+
+    Pass already_on_profile=True when the caller has just loaded the profile
+    page, skipping the current_url probe and any re-navigation."""
     logging.info("Starting resume upload process...")
-    
+
     try:
         # Ensure we're on the profile page
-        if "/mnjuser/profile" not in driver.current_url:
+        if not already_on_profile and "/mnjuser/profile" not in driver.current_url:
             logging.info("Navigating to profile page for resume upload")
             driver.get("https://www.naukri.com/mnjuser/profile")
-            time.sleep(5)
         
         # Find the resume upload section
         resume_section_found = False
@@ -268,28 +350,21 @@ def upload_resume(driver):
             # Send the file path to the input
             file_input.send_keys(resume_filepath)
             logging.info(f"Uploading resume file: {resume_filename}...")
-            
-            # Wait for upload to complete
-            time.sleep(10)
-            
-            # Check for success indicators
+
+            # Check for success indicators (these waits cover upload time)
             try:
-                success_indicators = [
-                    "//div[contains(text(), 'uploaded successfully')]",
-                    "//div[contains(text(), 'Resume updated')]",
-                    "//div[contains(@class, 'updateOn')]"
-                ]
-                
+                # Poll all three indicators in one wait (worst case 5s total,
+                # not 5s per indicator)
                 success_found = False
-                for indicator in success_indicators:
-                    try:
-                        WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, indicator))
-                        )
-                        success_found = True
-                        break
-                    except:
-                        continue
+                try:
+                    WebDriverWait(driver, 5).until(EC.any_of(
+                        EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'uploaded successfully')]")),
+                        EC.presence_of_element_located((By.XPATH, "//div[contains(text(), 'Resume updated')]")),
+                        EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'updateOn')]")),
+                    ))
+                    success_found = True
+                except TimeoutException:
+                    pass
                 
                 if success_found:
                     logging.info(f"✓ Resume '{resume_filename}' uploaded successfully")
@@ -297,8 +372,8 @@ def upload_resume(driver):
                 else:
                     # Wait for any loading indicators to disappear
                     try:
-                        WebDriverWait(driver, 15).until_not(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, ".saving, .loading, .spinner"))
+                        WebDriverWait(driver, 15, poll_frequency=0.05).until_not(
+                            EC.presence_of_element_located(LOADING_LOC)
                         )
                     except:
                         pass
@@ -322,107 +397,91 @@ def upload_resume(driver):
         save_screenshot(driver, "resume_upload_process_error", "failure")
         return False
 
+RESUME_KEYWORDS = ('resume', 'cv', 'curriculum', 'vitae', 'barkat')
+
+
 def find_resume_file():
     """Find a resume file in the current directory.
-    
-    Priority:
-    1. Files with 'resume' or 'cv' in the name (case insensitive) and .pdf extension
-    2. Any PDF file
+
+    Single os.scandir pass: returns as soon as a PDF with a resume keyword in
+    its name is seen, falling back to the first PDF encountered otherwise.
     """
-    current_dir = os.getcwd()
-    logging.info(f"Looking for resume files...")
-    
+    logging.info("Looking for resume files...")
+
+    fallback_path = None
     try:
-        files = os.listdir(current_dir)
-        pdf_files = [f for f in files if f.lower().endswith('.pdf')]
-        
-        if not pdf_files:
-            logging.info("No PDF files found")
-            return None
-        
-        # First priority: Look for files with keyword in the name
-        resume_keywords = ['resume', 'cv', 'curriculum', 'vitae', 'barkat']
-        for keyword in resume_keywords:
-            for pdf in pdf_files:
-                if keyword.lower() in pdf.lower():
-                    resume_path = os.path.join(current_dir, pdf)
-                    logging.info(f"Found resume file: {pdf}")
-                    return resume_path
-        
-        # Second priority: Just use the first PDF file found
-        if pdf_files:
-            resume_path = os.path.join(current_dir, pdf_files[0])
-            logging.info(f"Using PDF file: {pdf_files[0]}")
-            return resume_path
-        
+        with os.scandir(os.getcwd()) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                name_lower = entry.name.lower()
+                if not name_lower.endswith('.pdf'):
+                    continue
+                if any(keyword in name_lower for keyword in RESUME_KEYWORDS):
+                    logging.info(f"Found resume file: {entry.name}")
+                    return entry.path
+                if fallback_path is None:
+                    fallback_path = entry.path
+
+        if fallback_path:
+            logging.info(f"Using PDF file: {os.path.basename(fallback_path)}")
+            return fallback_path
+
+        logging.info("No PDF files found")
         return None
     except Exception as e:
         logging.error(f"Error finding resume file: {e}")
         return None
 
 def click_save_button(driver, save_button, description=""):
-    """Ensure save buttons are properly clicked with multiple fallback methods"""
+    """Ensure save buttons are properly clicked with multiple fallback methods.
+    All strategies (direct click, synthetic event, form submit) run inside one
+    browser call, so a failed attempt costs nothing instead of a full
+    interactability-error round-trip."""
     logging.info(f"Clicking {description} save button")
-    
+
     # Ensure the button is visible and centered
     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", save_button)
-    time.sleep(1)
-    
-    # Take multiple approaches to click the button
-    methods_tried = []
-    
-    # Method 1: Try direct click
+
+    click_method = None
     try:
-        save_button.click()
-        methods_tried.append("direct")
-    except Exception:
-        # Method 2: Try JavaScript click
-        try:
-            driver.execute_script("arguments[0].click();", save_button)
-            methods_tried.append("javascript")
-        except Exception:
-            # Method 3: Try dispatch click event
-            try:
-                driver.execute_script("""
-                    var clickEvent = new MouseEvent('click', {
-                        bubbles: true,
-                        cancelable: true,
-                        view: window
-                    });
-                    arguments[0].dispatchEvent(clickEvent);
-                """, save_button)
-                methods_tried.append("event")
-            except Exception:
-                # Method 4: Try form submit
-                try:
-                    driver.execute_script("""
-                        var el = arguments[0];
-                        var form = el.closest('form');
-                        if (form) {
-                            form.submit();
-                            return "Submitted parent form";
-                        }
-                        return "No parent form found";
-                    """, save_button)
-                    methods_tried.append("form")
-                except Exception:
-                    pass
-    
+        click_method = driver.execute_script("""
+            var el = arguments[0];
+            try { el.click(); return 'direct'; } catch (e) {}
+            try {
+                el.dispatchEvent(new MouseEvent('click', {
+                    bubbles: true,
+                    cancelable: true,
+                    view: window
+                }));
+                return 'event';
+            } catch (e) {}
+            var form = el.closest('form');
+            if (form) { form.submit(); return 'form'; }
+            return null;
+        """, save_button)
+    except Exception as e:
+        logging.error(f"Save button click script failed: {e}")
+
     # Wait for the save operation to complete
     try:
-        WebDriverWait(driver, 15).until_not(
-            EC.presence_of_element_located((By.CSS_SELECTOR, ".saving, .loading, .spinner"))
+        WebDriverWait(driver, 15, poll_frequency=0.05).until_not(
+            EC.presence_of_element_located(LOADING_LOC)
         )
     except:
-        # If no loading indicator found, just wait
-        time.sleep(10)
+        # Exponential backoff instead of a blanket 10s sleep: stop as soon as
+        # no loading indicator remains
+        for delay in (0.1, 0.2, 0.4, 0.8, 1.5, 3.0):
+            if not driver.find_elements(*LOADING_LOC):
+                break
+            time.sleep(delay)
     
-    if len(methods_tried) > 0:
+    if click_method:
         logging.info("Save button clicked successfully")
     else:
         logging.error("Failed to click save button")
-        
-    return len(methods_tried) > 0
+
+    return bool(click_method)
 
 def update_resume_headline(driver, headline_text):
     """Update the resume headline by clicking the edit button and modifying the content"""
@@ -431,40 +490,30 @@ def update_resume_headline(driver, headline_text):
     try:
         # Find and click the edit button for headline section
         try:
-            edit_button = None
-            
-            # Method 1: Look for the edit icon inside the widgetHead section
-            edit_buttons = driver.find_elements(By.CSS_SELECTOR, ".widgetHead .edit.icon")
-            if edit_buttons and len(edit_buttons) > 0:
-                edit_button = edit_buttons[0]
-            
-            # Method 2: Look for edit buttons by XPath
-            if not edit_button:
-                xpath_edit_buttons = driver.find_elements(By.XPATH, "//span[contains(@class, 'edit icon')]")
-                if xpath_edit_buttons and len(xpath_edit_buttons) > 0:
-                    edit_button = xpath_edit_buttons[0]
-            
-            # Method 3: Look for any element with "edit" in its class
-            if not edit_button:
-                generic_edit_buttons = driver.find_elements(By.CSS_SELECTOR, ".edit")
-                if generic_edit_buttons and len(generic_edit_buttons) > 0:
-                    edit_button = generic_edit_buttons[0]
+            # All three lookup methods run in the browser in one round-trip,
+            # preserving the original priority order
+            edit_button = driver.execute_script("""
+                var el = document.querySelector('.widgetHead .edit.icon');
+                if (el) return el;
+                var xp = document.evaluate("//span[contains(@class, 'edit icon')]",
+                    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+                if (xp.singleNodeValue) return xp.singleNodeValue;
+                return document.querySelector('.edit');
+            """)
             
             if edit_button:
                 logging.info("Clicking headline edit button")
                 driver.execute_script("arguments[0].click();", edit_button)
-                time.sleep(3)
             else:
                 logging.info("Trying direct navigation to edit page")
                 # Try navigating directly to the edit page
                 driver.get("https://www.naukri.com/mnjuser/profile?id=&altresid")
-                time.sleep(5)
-                
+                wait_for(driver, (By.XPATH, "//button[contains(text(), 'Edit Resume Headline')]"), timeout=5)
+
                 # Try clicking button by text
                 headline_section_buttons = driver.find_elements(By.XPATH, "//button[contains(text(), 'Edit Resume Headline')]")
                 if headline_section_buttons:
                     driver.execute_script("arguments[0].click();", headline_section_buttons[0])
-                    time.sleep(3)
                 else:
                     logging.error("Could not find any way to edit headline")
                     save_screenshot(driver, "headline_edit_button_not_found", "failure")
@@ -474,12 +523,11 @@ def update_resume_headline(driver, headline_text):
             save_screenshot(driver, "headline_edit_button_error", "failure")
             return False
         
-        # Wait for edit form to appear
-        time.sleep(3)
-        
-        # Find the textarea field
+        # Wait for the edit form's textarea to appear
         try:
-            headline_field = driver.find_element(By.ID, "resumeHeadlineTxt")
+            headline_field = wait_for(driver, HEADLINE_FIELD_LOC)
+            if headline_field is None:
+                raise NoSuchElementException("resumeHeadlineTxt did not appear")
             logging.info("Found headline textarea")
             
             # Get the current value for verification
@@ -501,26 +549,17 @@ def update_resume_headline(driver, headline_text):
                 updated_value = headline_field.get_attribute("value") or headline_field.text
                 logging.info(f"UPDATED HEADLINE: '{updated_value}'")
             
-            # Find the save button
-            save_button = None
-            
-            # Direct targeting: btn-dark-ot with type submit
-            save_buttons = driver.find_elements(By.CSS_SELECTOR, "button.btn-dark-ot[type='submit']")
-            if save_buttons and len(save_buttons) > 0:
-                save_button = save_buttons[0]
-            
-            # Fallback 1: Try just by class
-            if not save_button:
-                save_buttons = driver.find_elements(By.CSS_SELECTOR, ".btn-dark-ot")
-                if save_buttons and len(save_buttons) > 0:
-                    save_button = save_buttons[0]
-            
-            # Fallback 2: Try by text and class
-            if not save_button:
-                save_buttons = driver.find_elements(By.XPATH, 
-                    "//button[contains(text(), 'Save') or contains(@class, 'saveButton')]")
-                if save_buttons and len(save_buttons) > 0:
-                    save_button = save_buttons[0]
+            # Find the save button: direct target, class-only and text-based
+            # fallbacks all evaluated in one browser round-trip
+            save_button = driver.execute_script("""
+                var el = document.querySelector("button.btn-dark-ot[type='submit']")
+                    || document.querySelector('.btn-dark-ot');
+                if (el) return el;
+                var xp = document.evaluate(
+                    "//button[contains(text(), 'Save') or contains(@class, 'saveButton')]",
+                    document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+                return xp.singleNodeValue;
+            """)
             
             if save_button:
                 # Use the dedicated function to ensure proper clicking
@@ -530,52 +569,40 @@ def update_resume_headline(driver, headline_text):
                 # Check if the update was successful by returning to profile
                 driver.get("https://www.naukri.com/mnjuser/profile")
                 logging.info("Navigated back to profile page to verify update")
-                time.sleep(5)
+                wait_for_js(driver,
+                    "document.querySelector('.resumeHeadline') && "
+                    "document.querySelector('.resumeHeadline').textContent.length > 10",
+                    timeout=15)
                 
-                # Verify headline update with multiple methods
+                # Verify headline update: one batched in-browser check instead
+                # of a JS extraction plus several full page_source transfers
                 logging.info("Verifying headline update...")
-                
-                # Method 1: Direct JavaScript extraction
-                updated_headline_on_page = driver.execute_script("""
-                    var headlineElements = document.querySelectorAll('.resumeHeadline span, .resumeHeadline p, .resumeHeadline div, .resumeHeadline, .headline');
-                    for (var i = 0; i < headlineElements.length; i++) {
-                        var text = headlineElements[i].textContent.trim();
-                        if (text && text.length > 10) {
-                            return text;
-                        }
-                    }
-                    return null;
-                """)
-                
-                if updated_headline_on_page:
-                    logging.info(f"HEADLINE ON PAGE AFTER UPDATE: '{updated_headline_on_page}'")
-                    
-                    # Check if the new headline text is contained in what's displayed
-                    if headline_text in updated_headline_on_page:
-                        logging.info(f"✓ Headline updated successfully to: \"{headline_text}\"")
-                        return True
-                
-                # Method 2: Look for exact headline in page source
-                if headline_text in driver.page_source:
-                    logging.info(f"✓ Headline updated successfully to: \"{headline_text}\"")
-                    return True
-                
-                # Method 3: Look for truncated headline (first 50 chars)
-                headline_start = headline_text[:50]
-                if headline_start in driver.page_source:
-                    logging.info(f"✓ Headline updated successfully to: \"{headline_text}\"")
-                    return True
-                
-                # Method 4: Look for keyword matches
+
                 headline_words = [word for word in headline_text.split() if len(word) > 5]
-                matches = 0
-                matching_words = []
-                for word in headline_words:
-                    if word in driver.page_source:
-                        matches += 1
-                        matching_words.append(word)
-                
-                if matches >= 2 and len(headline_words) >= 2:
+                verification = driver.execute_script("""
+                    var want = arguments[0], words = arguments[1];
+                    var el = document.querySelector('.resumeHeadline');
+                    var txt = el ? el.innerText.trim() : '';
+                    var body = document.body.innerText;
+                    var hits = 0;
+                    for (var i = 0; i < words.length; i++) {
+                        if (body.indexOf(words[i]) >= 0) hits++;
+                    }
+                    return {
+                        txt: txt,
+                        contains: body.indexOf(want) >= 0,
+                        prefix: body.indexOf(want.slice(0, 50)) >= 0,
+                        hits: hits
+                    };
+                """, headline_text, headline_words) or {}
+
+                if verification.get("txt"):
+                    logging.info(f"HEADLINE ON PAGE AFTER UPDATE: '{verification['txt']}'")
+
+                if (headline_text in verification.get("txt", "")
+                        or verification.get("contains")
+                        or verification.get("prefix")
+                        or (verification.get("hits", 0) >= 2 and len(headline_words) >= 2)):
                     logging.info(f"✓ Headline updated successfully to: \"{headline_text}\"")
                     return True
                 
@@ -1,40 +1,163 @@
 import os
-import sys
-import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from utils import init_driver, login, save_screenshot
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(open(sys.stdout.fileno(), mode='w', encoding='utf-8', closefd=False))
-    ]
-)
-
-# Suppress logs from Selenium and WebDriverManager
-logging.getLogger("selenium").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
-
-def share_interest():
+from utils import (init_driver, get_driver, shutdown_driver, login, retry,
+                   reset_screenshot_dedup, save_screenshot, setup_logging)
+
+# Locators and conditions reused on every loop iteration
+_TUPLE_LOC = (By.CSS_SELECTOR, "div.tlc__tuple")
+_BUTTON_LOC = (By.CSS_SELECTOR, "div.tlc__tuple button.unshared")
+_SUCCESS_LOC = (By.XPATH, "//span[contains(text(), 'Interest shared successfully!')]")
+_WAIT_TUPLES = EC.presence_of_all_elements_located(_TUPLE_LOC)
+_WAIT_SUCCESS = EC.presence_of_element_located(_SUCCESS_LOC)
+
+# Thread-local driver storage for the parallel path: Selenium sessions must
+# never be shared across threads, so each worker lazily builds its own
+_thread_driver = threading.local()
+_worker_drivers = []
+_worker_drivers_lock = threading.Lock()
+
+
+def _get_thread_driver():
+    """Return this worker thread's own logged-in driver, creating it lazily."""
+    if getattr(_thread_driver, "driver", None) is None:
+        worker_driver = init_driver()
+        if not login(worker_driver):
+            worker_driver.quit()
+            raise RuntimeError("Worker login failed")
+        _thread_driver.driver = worker_driver
+        with _worker_drivers_lock:
+            _worker_drivers.append(worker_driver)
+    return _thread_driver.driver
+
+
+def _collect_unshared_job_links(driver, limit):
+    """Collect hrefs of up to `limit` jobs that still have an unshared button,
+    in one batched in-browser pass. These are the stable identities the
+    workers are dispatched on."""
+    return driver.execute_script("""
+        var limit = arguments[0];
+        var links = [];
+        var tuples = document.querySelectorAll('div.tlc__tuple');
+        for (var i = 0; i < tuples.length && links.length < limit; i++) {
+            if (!tuples[i].querySelector('button.unshared')) continue;
+            var a = tuples[i].querySelector('a');
+            if (a && a.href) links.push(a.href);
+        }
+        return links;
+    """, limit) or []
+
+
+def _share_job_link(job_link):
+    """Share interest in one specific job, identified by its href, using this
+    worker's own driver. Stable identities mean no two workers can race onto
+    the same job however the listing order shifts between page loads."""
+    try:
+        driver = _get_thread_driver()
+        driver.get("https://www.naukri.com/mnjuser/recommended-earjobs")
+        WebDriverWait(driver, 15, poll_frequency=0.25).until(_WAIT_TUPLES)
+
+        share_button = driver.execute_script("""
+            var href = arguments[0];
+            var tuples = document.querySelectorAll('div.tlc__tuple');
+            for (var i = 0; i < tuples.length; i++) {
+                var a = tuples[i].querySelector('a');
+                if (a && a.href === href)
+                    return tuples[i].querySelector('button.unshared');
+            }
+            return null;
+        """, job_link)
+        if share_button is None:
+            logging.info(f"Job no longer listed as unshared, skipping: {job_link}")
+            return False
+
+        driver.execute_script(
+            "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+            share_button)
+        try:
+            WebDriverWait(driver, 5).until(_WAIT_SUCCESS)
+            logging.info("Interest shared successfully!")
+        except TimeoutException:
+            logging.warning("No success confirmation found after clicking 'Share interest'")
+        return True
+    except Exception as e:
+        logging.error(f"Worker failed to share interest for {job_link}: {e}")
+        return False
+
+
+def _share_interest_parallel(limit, workers):
+    """Share interest in up to `limit` jobs with a small pool of worker
+    threads. One driver collects the target jobs' hrefs up front; the workers
+    (each owning its own logged-in driver) then share those specific jobs."""
+    collector = get_driver()
+    if not login(collector):
+        logging.error("Login failed. Exiting 'Share Interest' process.")
+        return 0
+
+    collector.get("https://www.naukri.com/mnjuser/recommended-earjobs")
+    try:
+        WebDriverWait(collector, 15, poll_frequency=0.25).until(_WAIT_TUPLES)
+    except TimeoutException:
+        logging.warning("Timed out waiting for job tuples to load")
+
+    job_links = _collect_unshared_job_links(collector, limit)
+    if not job_links:
+        logging.warning("No unshared job buttons found on the page")
+        return 0
+
+    shared = 0
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for ok in executor.map(_share_job_link, job_links):
+                if ok:
+                    shared += 1
+    finally:
+        with _worker_drivers_lock:
+            for worker_driver in _worker_drivers:
+                try:
+                    worker_driver.quit()
+                except Exception:
+                    pass
+            _worker_drivers.clear()
+        _thread_driver.driver = None
+    return shared
+
+
+def share_interest(driver=None):
     """
     Logs in to Naukri.com and shares interest in recommended jobs up to the EARLY_ACCESS_ROLES_LIMIT.
+
+    An already-logged-in driver can be passed in to reuse the existing browser
+    session (no second Chrome launch); in that case the caller keeps ownership
+    and the driver is not quit here.
     """
     logging.info("Starting 'Share Interest' process...")
-    
+    # New run, new screenshot budget (rotation's clear_debug_images does this
+    # for the other flows, but it doesn't run when only this task is enabled)
+    reset_screenshot_dedup()
+
     # Load environment variables
     early_access_limit = int(os.getenv("EARLY_ACCESS_ROLES_LIMIT", "2"))
-    
-    # Initialize the driver
-    driver = init_driver()
-    
+    workers = int(os.getenv("PARALLEL_WORKERS", "1"))
+
+    # Opt-in parallel path: only when no shared driver was passed in
+    if driver is None and workers > 1:
+        shared_count = _share_interest_parallel(early_access_limit, workers)
+        logging.info(f"✓ Successfully shared interest in {shared_count} jobs")
+        return
+
+    # Use the shared cached driver unless the caller supplied a logged-in one
+    owns_driver = driver is None
+    if owns_driver:
+        driver = get_driver()
+
     try:
-        # Login to Naukri
+        # Login to Naukri (no-op when the session is already authenticated)
         if not login(driver):
             logging.error("Login failed. Exiting 'Share Interest' process.")
             return
@@ -42,55 +165,63 @@ def share_interest():
         
         # Navigate to the recommended jobs page
         driver.get("https://www.naukri.com/mnjuser/recommended-earjobs")
-        time.sleep(5)
-        
+        wait = WebDriverWait(driver, 15, poll_frequency=0.25)
+        try:
+            wait.until(_WAIT_TUPLES)
+        except TimeoutException:
+            logging.warning("Timed out waiting for job tuples to load")
+
         shared_count = 0
+        consecutive_failures = 0
         while shared_count < early_access_limit:
             try:
-                # Locate all job tuples
-                job_tuples = driver.find_elements(By.CSS_SELECTOR, "div.tlc__tuple")
-                if not job_tuples:
-                    logging.warning("No job tuples found on the page")
+                # One query returns only the actionable buttons, instead of
+                # fetching every tuple and probing each for its button
+                share_buttons = driver.find_elements(*_BUTTON_LOC)
+                if not share_buttons:
+                    logging.warning("No unshared job buttons found on the page")
                     break
-                
-                for index, job in enumerate(job_tuples):
-                    if shared_count >= early_access_limit:
-                        break
-                    
+
+                try:
+                    # Scroll and click fused into one JS round-trip. The
+                    # retried callable re-locates the button on every attempt:
+                    # a stale handle never recovers, but a fresh query does.
+                    def _click_first_unshared():
+                        buttons = driver.find_elements(*_BUTTON_LOC)
+                        if not buttons:
+                            raise StaleElementReferenceException(
+                                "No unshared buttons present")
+                        driver.execute_script(
+                            "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();",
+                            buttons[0])
+
+                    retry(_click_first_unshared,
+                          exceptions=(StaleElementReferenceException,))
+                    logging.info(f"Clicked 'Share interest' button {shared_count + 1}/{early_access_limit}")
+                    shared_count += 1
+                    consecutive_failures = 0
+
+                    # Wait for success confirmation
                     try:
-                        # Locate the "Share interest" button within the job tuple
-                        share_button = job.find_element(By.CSS_SELECTOR, "button.unshared")
-                        
-                        # Scroll to the button and click it
-                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", share_button)
-                        time.sleep(1)
-                        share_button.click()
-                        logging.info(f"Clicked 'Share interest' button {shared_count + 1}/{early_access_limit}")
-                        shared_count += 1
-                        
-                        # Wait for success confirmation
-                        try:
-                            WebDriverWait(driver, 5).until(
-                                EC.presence_of_element_located((By.XPATH, "//span[contains(text(), 'Interest shared successfully!')]"))
-                            )
-                            logging.info("Interest shared successfully!")
-                        except TimeoutException:
-                            logging.warning("No success confirmation found after clicking 'Share interest'")
-                        
-                        time.sleep(2)  # Small delay between clicks
-                        
-                        # Navigate back to the recommended jobs page
-                        driver.get("https://www.naukri.com/mnjuser/recommended-earjobs")
-                        time.sleep(5)
-                        break  # Break to re-locate job tuples after navigating back
-                    except StaleElementReferenceException:
-                        logging.warning("Stale element encountered. Re-locating elements...")
-                        break  # Break the loop to re-locate elements
-                    except Exception as e:
+                        WebDriverWait(driver, 5).until(_WAIT_SUCCESS)
+                        logging.info("Interest shared successfully!")
+                    except TimeoutException:
+                        logging.warning("No success confirmation found after clicking 'Share interest'")
+
+                    # The button flips to a shared state in place -- no page
+                    # reload needed; the next pass re-queries what's left
+                except Exception as e:
+                    if isinstance(e, StaleElementReferenceException):
+                        logging.warning("Stale elements persisted through retries, re-locating...")
+                    else:
                         logging.error(f"Failed to click 'Share interest' button: {e}")
                         save_screenshot(driver, f"share_interest_error_{shared_count + 1}", "failure")
-                        continue
-                
+                    consecutive_failures += 1
+                    if consecutive_failures >= 3:
+                        # Repeated failures on the same page; bail out rather
+                        # than spinning
+                        break
+
             except Exception as e:
                 logging.error(f"Error during 'Share interest' process: {e}")
                 save_screenshot(driver, "share_interest_process_error", "failure")
@@ -101,9 +232,11 @@ def share_interest():
     except Exception as e:
         logging.error(f"Error in 'Share Interest' process: {e}")
         save_screenshot(driver, "share_interest_error", "failure")
-    finally:
-        driver.quit()
-        logging.info("Browser closed")
+        if owns_driver:
+            # A fatal error may have left the shared session unusable;
+            # recycle it so the next task starts with a fresh driver
+            shutdown_driver()
 
 if __name__ == "__main__":
+    setup_logging()
     share_interest()
\ No newline at end of file
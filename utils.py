@@ -1,8 +1,12 @@
 import os
+import json
 import time
+import atexit
 import logging
 import shutil
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
@@ -21,10 +25,39 @@ load_dotenv()
 IMAGES_DIR = os.path.join(os.getcwd(), "debug", "images")
 LOGS_DIR = os.path.join(os.getcwd(), "debug", "logs")
 
+# Cached session cookies so scheduled reruns can skip the multi-second login
+COOKIES_FILE = os.path.join(os.path.expanduser("~"), ".hirememaybe_cookies.json")
+
 # Ensure directories exist
 os.makedirs(IMAGES_DIR, exist_ok=True)
 os.makedirs(LOGS_DIR, exist_ok=True)
 
+# Resolved chromedriver path, cached so repeat driver inits skip the
+# webdriver-manager version check (network + disk) entirely
+_DRIVER_PATH = None
+
+
+def _resolve_driver_path():
+    global _DRIVER_PATH
+    if _DRIVER_PATH is None:
+        # Prefer webdriver-manager's local cache over its network check
+        os.environ.setdefault("WDM_LOCAL", "1")
+        os.environ.setdefault("WDM_LOG_LEVEL", "0")
+        _DRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH") or ChromeDriverManager().install()
+    return _DRIVER_PATH
+
+def retry(fn, exceptions=(WebDriverException,), tries=3, base=0.2):
+    """Call fn, retrying on the given transient exceptions with exponential
+    backoff (base, 2*base, 4*base...). Re-raises the final failure."""
+    for attempt in range(tries):
+        try:
+            return fn()
+        except exceptions:
+            if attempt == tries - 1:
+                raise
+            time.sleep(base * (2 ** attempt))
+
+
 def setup_logging():
     """
     Configures logging to write logs to a shared file and console.
@@ -36,7 +69,8 @@ def setup_logging():
         handlers=[
             logging.FileHandler(log_file),
             logging.StreamHandler()  # Optional: Logs to console
-        ]
+        ],
+        force=True  # Replace any handlers installed earlier
     )
     # Suppress logs from Selenium and WebDriverManager
     logging.getLogger("selenium").setLevel(logging.WARNING)
@@ -44,49 +78,238 @@ def setup_logging():
     logging.getLogger("webdriver_manager").setLevel(logging.WARNING)
     logging.info("Logging configured. Logs will be written to: %s", log_file)
 
-# Configure logging
-setup_logging()
+
+# Chrome flags applied to every driver. Caching is deliberately left ON with
+# a 100MB disk cache: the bot revisits the same Naukri pages every run, so
+# refetching every static asset per navigation was pure wasted bandwidth.
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--window-size=1920,1080",
+    # Don't load images to speed up
+    "--blink-settings=imagesEnabled=false",
+    # Add user agent to avoid detection
+    "--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
+    # Serve repeat navigations from the local cache
+    "--disk-cache-size=104857600",
+    # Prevent side effects / weird Chrome memory
+    "--disable-browser-side-navigation",
+    "--disable-site-isolation-trials",
+    # Trim per-driver memory so several drivers can run side by side
+    "--memory-pressure-off",
+    "--renderer-process-limit=1",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--mute-audio",
+    # Turn off renderer features a DOM-scraping bot never uses
+    "--disable-features=Translate,MediaRouter,OptimizationHints,BackForwardCache,"
+    "InterestFeedContentSuggestions,CalculateNativeWinOcclusion",
+    "--disable-plugins",
+    "--disable-default-apps",
+    "--no-first-run",
+    "--no-default-browser-check",
+    # Cap the V8 heap so a leaky page can't balloon the renderer
+    "--js-flags=--max-old-space-size=256",
+    # For Docker deployment, we need to use headless mode
+    "--headless=new",
+)
+
+
+def _profile_in_use(profile_dir):
+    """Check whether a live Chrome still holds this profile. Chrome's
+    SingletonLock is a symlink to 'hostname-pid'; a lock whose pid is gone is
+    stale (e.g. after a crash) and the profile is safe to reuse."""
+    lock_path = os.path.join(profile_dir, "SingletonLock")
+    if not os.path.lexists(lock_path):
+        return False
+    try:
+        pid = int(os.readlink(lock_path).rsplit("-", 1)[1])
+        os.kill(pid, 0)
+        return True
+    except (OSError, ValueError, IndexError):
+        # Stale or unreadable lock: clear it so Chrome doesn't refuse to start
+        try:
+            os.remove(lock_path)
+        except OSError:
+            pass
+        return False
+
+
+# In-process counter handing out profile directories. SingletonLock alone
+# cannot arbitrate concurrent launches (Chrome only creates it seconds after
+# startup), so concurrent drivers must never be pointed at the same dir in
+# the first place.
+_profile_count = 0
+_profile_lock = threading.Lock()
+
+
+def _next_profile_dir():
+    """Pick a user-data-dir for a new driver, collision-free by construction.
+
+    The first driver in a process gets the persistent profile (cookie/cache
+    reuse across runs); every later driver -- a concurrent task thread or a
+    forked pool worker, which inherits the parent's counter already past
+    zero -- gets a dir made unique by pid + per-process index."""
+    global _profile_count
+    base_dir = os.path.join(tempfile.gettempdir(), "chrome_user_data_naukri")
+    while True:
+        with _profile_lock:
+            index = _profile_count
+            _profile_count += 1
+        if index == 0:
+            profile_dir = base_dir
+        else:
+            profile_dir = f"{base_dir}_{os.getpid()}_{index}"
+        if not _profile_in_use(profile_dir):
+            break
+    os.makedirs(profile_dir, exist_ok=True)
+    return profile_dir
+
 
 def init_driver():
     """Initialize and return a configured Chrome WebDriver instance."""
     logging.debug("Initializing WebDriver with WebDriverManager for ChromeDriver")
-    
+
     chrome_options = Options()
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    # Don't load images to speed up
-    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
-    
-    # Add user agent to avoid detection
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36")
-    
-    # Disable all forms of cache
-    chrome_options.add_argument("--disable-application-cache")
-    chrome_options.add_argument("--disk-cache-size=0")
-    chrome_options.add_argument("--disable-cache")
-    chrome_options.add_argument("--media-cache-size=0")
+    for arg in _CHROME_ARGS:
+        chrome_options.add_argument(arg)
 
-    # Prevent side effects / weird Chrome memory
-    chrome_options.add_argument("--disable-browser-side-navigation")
-    chrome_options.add_argument("--disable-site-isolation-trials")
+    # Return from driver.get() on DOMContentLoaded instead of waiting for every
+    # ad/tracking subresource to finish loading
+    chrome_options.page_load_strategy = "eager"
 
-    # For Docker deployment, we need to use headless mode
-    chrome_options.add_argument("--headless=new")
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
     
-    # Use a temporary directory for user-data-dir
-    unique_dir = f"/tmp/chrome_user_data_{int(time.time())}"
-    chrome_options.add_argument(f"--user-data-dir={unique_dir}")
-    logging.debug(f"Using temporary user-data-dir: {unique_dir}")
+    # Reuse a persistent user-data-dir so cookies and cache survive across
+    # runs (skipping first-run profile creation and usually the login flow);
+    # concurrent drivers each get their own collision-free dir.
+    profile_dir = _next_profile_dir()
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    logging.debug(f"Using user-data-dir: {profile_dir}")
     
-    service = Service(ChromeDriverManager().install())
+    service = Service(_resolve_driver_path())
     driver = webdriver.Chrome(service=service, options=chrome_options)
-    
+
+    # Keep explicit waits as the only wait mechanism (implicit waits compound
+    # with WebDriverWait timeouts)
+    driver.implicitly_wait(0)
+
+    # Block ad/tracking requests at the network layer -- the job pages carry
+    # heavy third-party payloads the bot never needs
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*doubleclick*",
+            "*googletagmanager*",
+            "*google-analytics*",
+            "*facebook.net*",
+            "*hotjar*",
+            "*segment.io*",
+            "*clarity.ms*",
+            "*.woff",
+            "*.woff2",
+            "*.mp4",
+        ]})
+    except Exception as e:
+        logging.debug(f"Could not set CDP network blocks: {e}")
+
     logging.debug("WebDriver initialized successfully")
     return driver
 
+# Process-wide cached driver so adjacent bot flows don't each pay the 2-5s
+# Chrome spin-up; closed automatically at interpreter exit
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+
+
+def get_driver():
+    """Return the shared driver instance, creating it on first use."""
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is None:
+            _DRIVER = init_driver()
+        return _DRIVER
+
+
+def shutdown_driver():
+    """Quit the shared driver (if any); the next get_driver() starts fresh."""
+    global _DRIVER
+    with _DRIVER_LOCK:
+        if _DRIVER is not None:
+            try:
+                _DRIVER.quit()
+            except Exception:
+                pass
+            _DRIVER = None
+
+
+atexit.register(shutdown_driver)
+
+
+def restore_session_cookies(driver):
+    """Try to restore a previous logged-in session from cached cookies.
+    Returns True if the restored session is still authenticated."""
+    if not os.path.exists(COOKIES_FILE):
+        return False
+
+    try:
+        with open(COOKIES_FILE, "r") as f:
+            cookies = json.load(f)
+    except (json.JSONDecodeError, OSError) as e:
+        logging.warning(f"Could not read cached cookies: {e}")
+        return False
+
+    try:
+        driver.get("https://www.naukri.com")
+        now = time.time()
+        for cookie in cookies:
+            # Skip cookies that have already expired
+            if cookie.get("expiry") and cookie["expiry"] < now:
+                continue
+            try:
+                driver.add_cookie(cookie)
+            except WebDriverException:
+                continue
+
+        driver.get("https://www.naukri.com/mnjuser/profile")
+        if "login" not in driver.current_url.lower():
+            logging.info("Restored logged-in session from cached cookies")
+            return True
+    except Exception as e:
+        logging.warning(f"Cookie session restore failed: {e}")
+
+    return False
+
+
+def save_session_cookies(driver):
+    """Cache session cookies so the next scheduled run can skip the login flow."""
+    try:
+        with open(COOKIES_FILE, "w") as f:
+            json.dump(driver.get_cookies(), f)
+        logging.debug("Session cookies cached for future runs")
+    except Exception as e:
+        logging.warning(f"Failed to cache session cookies: {e}")
+
+
+# Sets an input's value in one call instead of per-character send_keys
+# commands. Uses the native value setter so React-style change detection
+# still sees the update.
+_SET_INPUT_VALUE_JS = """
+    var el = arguments[0], value = arguments[1];
+    var setter = Object.getOwnPropertyDescriptor(
+        window.HTMLInputElement.prototype, 'value').set;
+    setter.call(el, value);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+
 def login(driver, max_attempts=3):
     """Login to Naukri.com with credentials from environment variables"""
     email = os.environ.get("NAUKRI_EMAIL")
@@ -95,7 +318,20 @@ def login(driver, max_attempts=3):
     if not email or not password:
         logging.error("Naukri credentials not found in environment variables")
         return False
-    
+
+    # The persistent browser profile may already hold a live session
+    try:
+        driver.get("https://www.naukri.com/mnjuser/profile")
+        if "login" not in driver.current_url.lower():
+            logging.info("Already logged in (persistent browser profile)")
+            return True
+    except WebDriverException:
+        pass
+
+    # Otherwise try the cached cookies before the slow login flow
+    if restore_session_cookies(driver):
+        return True
+
     logging.info("Navigating to login page...")
     driver.get("https://www.naukri.com/nlogin/login")
     
@@ -119,18 +355,16 @@ def login(driver, max_attempts=3):
             
             # Locate and fill email field
             email_field = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@id='usernameField']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#usernameField"))
             )
-            email_field.clear()
-            email_field.send_keys(email)
+            driver.execute_script(_SET_INPUT_VALUE_JS, email_field, email)
             logging.debug("Email entered successfully")
             
             # Locate and fill password field
             password_field = WebDriverWait(driver, 20).until(
-                EC.presence_of_element_located((By.XPATH, "//input[@id='passwordField']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, "#passwordField"))
             )
-            password_field.clear()
-            password_field.send_keys(password)
+            driver.execute_script(_SET_INPUT_VALUE_JS, password_field, password)
             logging.debug("Password entered successfully")
             
             # Locate and click login button
@@ -146,6 +380,7 @@ def login(driver, max_attempts=3):
             # Check if login was successful
             if "login" not in driver.current_url.lower():
                 logging.info("Login successful")
+                save_session_cookies(driver)
                 return True
             
             # If still on login page, check for error messages
@@ -168,43 +403,118 @@ def login(driver, max_attempts=3):
     save_screenshot(driver, "login_failed_final", "failure")
     return False
 
-def save_screenshot(driver, name, status="info"):
+# Background writer so PNG disk IO never blocks the driver thread. The capture
+# itself (get_screenshot_as_png) must stay on the caller's thread because
+# Selenium drivers are not thread-safe.
+_screenshot_writer = ThreadPoolExecutor(max_workers=2)
+_pending_screenshots = []
+
+
+def _write_screenshot(path, png_bytes):
+    try:
+        with open(path, "wb") as f:
+            f.write(png_bytes)
+    except Exception as e:
+        logging.error(f"Failed to write screenshot {os.path.basename(path)}: {e}")
+
+
+def reset_screenshot_writer():
+    """Recreate the background screenshot writer and drop pending futures.
+    Required in forked worker processes: they inherit the executor's
+    bookkeeping but not its threads, so anything submitted to the inherited
+    executor would never be written."""
+    global _screenshot_writer, _pending_screenshots
+    _screenshot_writer = ThreadPoolExecutor(max_workers=2)
+    _pending_screenshots = []
+
+
+def flush_screenshots(timeout=10):
+    """Block until all queued screenshot writes have hit disk.
+    Call at the end of a run so nothing is lost when the process exits."""
+    global _pending_screenshots
+    pending, _pending_screenshots = _pending_screenshots, []
+    for future in pending:
+        try:
+            future.result(timeout=timeout)
+        except Exception:
+            pass
+
+
+atexit.register(flush_screenshots)
+
+
+# Tags captured during the current run; a failure that bubbles through nested
+# handlers would otherwise trigger several near-identical captures
+_captured_tags = set()
+
+
+def reset_screenshot_dedup():
+    """Forget which screenshot tags were captured. Called at run start."""
+    _captured_tags.clear()
+
+
+def _screenshot_enabled(status):
+    """Check the SCREENSHOT_LEVEL setting ('none', 'failure' or 'all').
+    The default 'failure' keeps the many info-level captures off the hot path
+    but still records failures, warnings and the proof-of-application
+    success shots."""
+    level = os.getenv("SCREENSHOT_LEVEL", "failure").lower()
+    if level == "none":
+        return False
+    if level == "all":
+        return True
+    return status in ("failure", "warning", "success")
+
+
+def save_screenshot(driver, name, status="info", full=False):
     """
     Take a screenshot and save it with current timestamp.
     Returns the path to the saved screenshot.
-    Status can be 'success', 'failure', 'warning', or 'info'
+    Status can be 'success', 'failure', 'warning', or 'info'.
+    Captures the viewport only by default; pass full=True for the slower
+    resize-to-page capture.
     """
+    if not _screenshot_enabled(status):
+        return None
+
+    # Dedup only failure/warning captures -- those are what cascading
+    # exception handlers fire repeatedly. Success/info names can legitimately
+    # repeat (e.g. two different jobs at the same company in one run).
+    if status in ("failure", "warning"):
+        tag = f"{status}_{name}"
+        if tag in _captured_tags:
+            logging.debug(f"Screenshot '{tag}' already captured this run, skipping")
+            return None
+        _captured_tags.add(tag)
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     screenshot_dir = IMAGES_DIR
-    
+
     # Format the filename
     filename = f"{status}_{name}_{timestamp}.png"
     screenshot_path = os.path.join(screenshot_dir, filename)
-    
+
     try:
-        # Ensure page is fully loaded and stable
-        time.sleep(1)
-        
-        # Take full page screenshot by scrolling
-        total_width = driver.execute_script("return document.body.offsetWidth")
-        total_height = driver.execute_script("return document.body.scrollHeight")
-        
-        # Set appropriate window size
-        driver.set_window_size(total_width, min(total_height, 1200))
-        
-        # Allow time for resizing
-        time.sleep(0.5)
-        
-        # Save the screenshot
-        driver.save_screenshot(screenshot_path)
-        
-        if os.path.exists(screenshot_path):
-            logging.info(f"Screenshot saved: {filename}")
-            return screenshot_path
-        else:
-            logging.error(f"Failed to save screenshot: {filename}")
-            return None
-            
+        # Ensure the page has finished loading (bounded wait, no fixed sleep)
+        try:
+            WebDriverWait(driver, 2).until(
+                lambda d: d.execute_script("return document.readyState") == "complete")
+        except TimeoutException:
+            pass
+
+        if full:
+            # Resize the window to capture the whole page
+            total_width = driver.execute_script("return document.body.offsetWidth")
+            total_height = driver.execute_script("return document.body.scrollHeight")
+            driver.set_window_size(total_width, min(total_height, 1200))
+
+        # Capture on this thread, write to disk in the background
+        png = driver.get_screenshot_as_png()
+        _pending_screenshots.append(
+            _screenshot_writer.submit(_write_screenshot, screenshot_path, png))
+        logging.info(f"Screenshot saved: {filename}")
+        return screenshot_path
+
     except Exception as e:
         logging.exception(f"Error taking screenshot {name}: {e}")
         try: